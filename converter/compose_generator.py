@@ -1,12 +1,228 @@
 """Compose Vector Drawable code generation module."""
 
+import os
 import re
 import logging
+from dataclasses import replace
+from functools import lru_cache
 from typing import List, Optional
 from .svg_parser import SVGData, PathData, GroupData
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for path tokenizing and name normalization
+_RE_PATH_TOKEN = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_RE_NONALNUM = re.compile(r'[^a-zA-Z0-9]')
+_RE_PKG_SEG = re.compile(r'[^a-zA-Z0-9]')
+
+# Opcodes for parsed path commands; relative H/V keep their offset and get their own opcode
+_M, _L, _H, _V, _C, _S, _Q, _T, _A, _Z, _H_REL, _V_REL = range(12)
+
+# Path command letter -> (opcode, number of coordinates consumed, is relative)
+_COMMAND_INFO = {
+    'M': (_M, 2, False), 'm': (_M, 2, True),
+    'L': (_L, 2, False), 'l': (_L, 2, True),
+    'H': (_H, 1, False), 'h': (_H, 1, True),
+    'V': (_V, 1, False), 'v': (_V, 1, True),
+    'C': (_C, 6, False), 'c': (_C, 6, True),
+    'S': (_S, 4, False), 's': (_S, 4, True),
+    'Q': (_Q, 4, False), 'q': (_Q, 4, True),
+    'T': (_T, 2, False), 't': (_T, 2, True),
+    'A': (_A, 7, False), 'a': (_A, 7, True),
+    'Z': (_Z, 0, False), 'z': (_Z, 0, True),
+}
+
+# Kotlin line template per opcode, indexed by command[0]; each takes (indent, *command[1:])
+_EMITTERS = (
+    "%smoveTo(%.0ff, %.0ff)",                                # _M
+    "%slineTo(%.0ff, %.0ff)",                                # _L
+    "%shorizontalLineTo(%.0ff)",                             # _H
+    "%sverticalLineTo(%.0ff)",                               # _V
+    "%scurveTo(%.2ff, %.2ff, %.2ff, %.2ff, %.2ff, %.2ff)",   # _C
+    "%sreflectiveCurveTo(%.2ff, %.2ff, %.2ff, %.2ff)",       # _S
+    "%squadTo(%.2ff, %.2ff, %.2ff, %.2ff)",                  # _Q
+    "%sreflectiveQuadTo(%.2ff, %.2ff)",                      # _T
+    "%sarcTo(%.2ff, %.2ff, %.2ff, %s, %s, %.2ff, %.2ff)",    # _A
+    "%sclose()",                                             # _Z
+    "%shorizontalLineToRelative(%.0ff)",                     # _H_REL
+    "%sverticalLineToRelative(%.0ff)",                       # _V_REL
+)
+
+# Filename separators that start a new word in convert_to_pascal_case
+# (whitespace is handled by str.split)
+_PASCAL_SEPARATORS = str.maketrans('_-.@#()[]', ' ' * 9)
+
+_KOTLIN_KEYWORDS = frozenset({
+    'class', 'object', 'interface', 'fun', 'val', 'var', 'if', 'else',
+    'when', 'for', 'while', 'do', 'try', 'catch', 'finally', 'return',
+    'break', 'continue', 'throw', 'import', 'package', 'as', 'is', 'in'
+})
+
+# Compose equivalents of the SVG named colors we recognize
+_NAMED_COMPOSE_COLORS = {
+    "black": "Color.Black",
+    "white": "Color.White",
+    "red": "Color.Red",
+    "green": "Color.Green",
+    "blue": "Color.Blue",
+    "transparent": "Color.Transparent",
+}
+
+# Kotlin file scaffolding around the path definitions, filled with %-mapping substitution
+_KOTLIN_HEADER = """package %(package)s
+
+import androidx.compose.ui.graphics.Color
+import androidx.compose.ui.graphics.PathFillType
+import androidx.compose.ui.graphics.SolidColor
+import androidx.compose.ui.graphics.vector.ImageVector
+import androidx.compose.ui.graphics.vector.group
+import androidx.compose.ui.graphics.vector.path
+import androidx.compose.ui.unit.dp
+
+val %(icon)s: ImageVector
+    get() {
+        if (_%(icon)s != null) return _%(icon)s!!
+
+        _%(icon)s = ImageVector.Builder(
+            name = "%(icon)s",
+            defaultWidth = %(width).1f.dp,
+            defaultHeight = %(height).1f.dp,
+            viewportWidth = %(viewport_width).1ff,
+            viewportHeight = %(viewport_height).1ff
+        ).apply {"""
+
+_KOTLIN_FOOTER = """        }.build()
+
+        return _%(icon)s!!
+    }
+
+private var _%(icon)s: ImageVector? = null
+"""
+
+# Indent strings for nesting depths up to 31 (deeper groups fall back to multiplication)
+_INDENTS = tuple("    " * i for i in range(32))
+
+
+def _indent(level: int) -> str:
+    """Return the indent string for a nesting level."""
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return "    " * level
+
+
+@lru_cache(maxsize=256)
+def _compose_color(color: str) -> Optional[str]:
+    """Convert an SVG color string to a Compose Color expression.
+    
+    Icon sets reuse a handful of colors across thousands of paths, so
+    results are memoized per color string.
+    """
+    if not color:
+        return None
+    
+    color_lower = color.lower()
+    if color_lower == "none":
+        return None
+    
+    # Handle named colors
+    named_color = _NAMED_COMPOSE_COLORS.get(color_lower)
+    if named_color:
+        return named_color
+        
+    # Handle hex colors
+    if color_lower.startswith("#"):
+        hex_digits = color[1:].upper()
+        if len(hex_digits) == 6:  # #RRGGBB
+            return f"Color(0xFF{hex_digits})"
+        elif len(hex_digits) == 3:  # #RGB
+            r, g, b = hex_digits
+            return f"Color(0xFF{r}{r}{g}{g}{b}{b})"
+    
+    # Default to black if can't parse
+    logger.warning(f"Unknown color format: {color}, defaulting to black")
+    return "Color.Black"
+
+
+@lru_cache(maxsize=1024)
+def _compose_color_with_opacity(color: str, opacity: float = 1.0) -> Optional[str]:
+    """Convert an SVG color string to a Compose Color expression with opacity."""
+    if not color or color.lower() == "none":
+        return None
+        
+    # Get the base color
+    base_color = _compose_color(color)
+    if not base_color:
+        return None
+        
+    # If opacity is 1.0, return base color as-is
+    if opacity >= 1.0:
+        return base_color
+        
+    # Apply opacity to the color
+    if base_color.startswith("Color(0xFF"):
+        # Extract hex value and apply alpha
+        hex_part = base_color[10:-1]  # Remove "Color(0xFF" and ")"
+        alpha_hex = format(int(opacity * 255), '02X')
+        return f"Color(0x{alpha_hex}{hex_part})"
+    else:
+        # For named colors, use copy(alpha = x)
+        return f"{base_color}.copy(alpha = {opacity:.2f}f)"
+
+
+@lru_cache(maxsize=512)
+def _build_package_name_cached(base_package: str, dir_path: str) -> str:
+    """Build a package name from a base package and a relative directory path."""
+    # Convert directory path to package path
+    # Example: icons/actions -> icons.actions
+    path_parts = []
+    
+    # Split directory path and normalize for package naming
+    for part in dir_path.split(os.sep):
+        if part:  # Skip empty parts
+            # Normalize package segment (replace dashes with underscores, etc.)
+            normalized_part = _RE_PKG_SEG.sub('_', part.lower())
+            if normalized_part and not normalized_part[0].isdigit():
+                path_parts.append(normalized_part)
+    
+    if path_parts:
+        return f"{base_package}.{'.'.join(path_parts)}"
+    else:
+        return base_package
+
+
+@lru_cache(maxsize=4096)
+def _pascal_case(name: str) -> str:
+    """Convert snake_case or kebab-case to PascalCase with Kotlin-safe naming."""
+    # Handle both snake_case, kebab-case, and other separators
+    words = name.translate(_PASCAL_SEPARATORS).split()
+    
+    # Clean and capitalize each word
+    clean_words = []
+    for word in words:
+        # Remove any remaining invalid characters and ensure alphanumeric;
+        # plain ASCII words (the common case) skip the regex entirely
+        if not (word.isascii() and word.isalnum()):
+            word = _RE_NONALNUM.sub('', word)
+            if not word:
+                continue
+        # Ensure doesn't start with number
+        if word[0].isdigit():
+            word = 'Icon' + word
+        clean_words.append(word.capitalize())
+    
+    # Join words and ensure result is valid
+    result = ''.join(clean_words)
+    
+    # Fallback if empty or invalid
+    if not result or not result[0].isalpha():
+        result = 'Icon' + (result if result else 'Unknown')
+    
+    # Handle Kotlin keywords
+    if result.lower() in _KOTLIN_KEYWORDS:
+        result = result + 'Icon'
+    
+    return result
+
 
 class ComposeGenerator:
     """Generates Compose ImageVector code from SVG data."""
@@ -19,52 +235,32 @@ class ComposeGenerator:
         # Convert filename to PascalCase for class name
         icon_name = self.convert_to_pascal_case(class_name)
         
-        # Generate path definitions and helper methods
-        path_definitions, helper_methods = self._generate_all_paths_with_splitting(svg_data, icon_name)
-        
         # Build package name with subdirectory structure
         package_name = self._build_package_name(relative_path)
         
-        # Build the complete Kotlin file content
-        kotlin_code = f"""package {package_name}
-
-import androidx.compose.ui.graphics.Color
-import androidx.compose.ui.graphics.PathFillType
-import androidx.compose.ui.graphics.SolidColor
-import androidx.compose.ui.graphics.vector.ImageVector
-import androidx.compose.ui.graphics.vector.group
-import androidx.compose.ui.graphics.vector.path
-import androidx.compose.ui.unit.dp
-
-val {icon_name}: ImageVector
-    get() {{
-        if (_{icon_name} != null) return _{icon_name}!!
+        # Build the complete Kotlin file content as a single list of lines
+        lines = [_KOTLIN_HEADER % {
+            'package': package_name,
+            'icon': icon_name,
+            'width': svg_data.width,
+            'height': svg_data.height,
+            'viewport_width': svg_data.viewbox.width,
+            'viewport_height': svg_data.viewbox.height,
+        }]
         
-        _{icon_name} = ImageVector.Builder(
-            name = "{icon_name}",
-            defaultWidth = {svg_data.width:.1f}.dp,
-            defaultHeight = {svg_data.height:.1f}.dp,
-            viewportWidth = {svg_data.viewbox.width:.1f}f,
-            viewportHeight = {svg_data.viewbox.height:.1f}f
-        ).apply {{
-{path_definitions}
-        }}.build()
+        # Write path definitions in place; helper methods go after the property
+        helper_lines = []
+        self._write_all_paths(lines, helper_lines, svg_data, icon_name)
         
-        return _{icon_name}!!
-    }}
-
-private var _{icon_name}: ImageVector? = null
-
-{helper_methods}"""
-
-        return self.format_kotlin_code(kotlin_code)
+        lines.append(_KOTLIN_FOOTER % {'icon': icon_name})
+        lines.extend(helper_lines or [""])
+        
+        return '\n'.join(lines)
 
-    def _generate_all_paths_with_splitting(self, svg_data: SVGData, icon_name: str) -> tuple[str, str]:
-        """Generate all path definitions with automatic splitting for large paths."""
+    def _write_all_paths(self, out: List[str], helper_out: List[str], svg_data: SVGData, icon_name: str) -> None:
+        """Write all path definitions to out, splitting large paths into helper methods in helper_out."""
         MAX_COMMANDS_PER_METHOD = 300  # Threshold to avoid JVM method size limits
         
-        path_codes = []
-        helper_methods = []
         helper_counter = 0
         
         # Generate standalone paths
@@ -73,118 +269,47 @@ private var _{icon_name}: ImageVector? = null
             
             if len(commands) > MAX_COMMANDS_PER_METHOD:
                 # Split large path into multiple helper methods
-                helper_calls = self._generate_split_path_methods(
-                    path_data, commands, icon_name, helper_counter, MAX_COMMANDS_PER_METHOD
+                helper_counter += self._write_split_path_methods(
+                    out, helper_out, path_data, commands, icon_name, helper_counter, MAX_COMMANDS_PER_METHOD
                 )
-                path_codes.extend(helper_calls['calls'])
-                helper_methods.extend(helper_calls['methods'])
-                helper_counter += len(helper_calls['methods'])
             else:
                 # Generate normal path
-                path_code = self.generate_path_code(path_data)
-                if path_code:
-                    path_codes.append(path_code)
+                self._write_path_code(out, path_data, commands=commands)
         
         # Generate grouped paths (handle large groups similarly)
         for group_data in svg_data.groups:
-            group_code = self.generate_group_code(group_data)
-            if group_code:
-                path_codes.append(group_code)
-        
-        # Join results
-        path_definitions = '\n'.join(path_codes)
-        helper_methods_str = '\n\n'.join(helper_methods) if helper_methods else ""
-        
-        return path_definitions, helper_methods_str
+            self._write_group_code(out, group_data)
 
-    def _generate_all_paths(self, svg_data: SVGData) -> str:
-        """Generate all path definitions from SVG data."""
-        path_codes = []
-        
-        # Generate standalone paths
-        for path_data in svg_data.paths:
-            path_code = self.generate_path_code(path_data)
-            if path_code:
-                path_codes.append(path_code)
-        
-        # Generate grouped paths
-        for group_data in svg_data.groups:
-            group_code = self.generate_group_code(group_data)
-            if group_code:
-                path_codes.append(group_code)
+    def _write_split_path_methods(self, out: List[str], helper_out: List[str], path_data: PathData,
+                                  commands: list, icon_name: str, helper_counter: int, max_commands: int) -> int:
+        """Split a large path into helper methods, writing calls to out and methods to helper_out.
         
-        # Join all path codes with proper indentation
-        return '\n'.join(path_codes)
-
-    def _generate_split_path_methods(self, path_data: PathData, commands: list, icon_name: str, 
-                                   helper_counter: int, max_commands: int) -> dict:
-        """Split a large path into multiple helper methods."""
+        Returns the number of helper methods written.
+        """
         # Split commands into chunks
         command_chunks = [commands[i:i + max_commands] for i in range(0, len(commands), max_commands)]
         
-        helper_methods = []
-        method_calls = []
-        
         # Generate helper methods for each chunk
         for i, chunk in enumerate(command_chunks):
             method_name = f"build{icon_name}Path{helper_counter + i + 1}"
             
-            # Create a temporary path data for this chunk
-            chunk_path_data = self._create_chunk_path_data(path_data, chunk)
-            
-            # Generate the helper method
-            helper_method = self._generate_path_helper_method(chunk_path_data, method_name)
-            helper_methods.append(helper_method)
+            # Generate the helper method, separated from the previous one by a blank line;
+            # the chunk's commands are formatted directly without re-parsing
+            if helper_out:
+                helper_out.append("")
+            self._write_path_helper_method(helper_out, path_data, chunk, method_name)
             
             # Generate the method call
-            method_call = f"            {method_name}()"
-            method_calls.append(method_call)
+            out.append(f"            {method_name}()")
         
-        return {
-            'methods': helper_methods,
-            'calls': method_calls
-        }
+        return len(command_chunks)
 
-    def _create_chunk_path_data(self, original_path_data: PathData, commands: list) -> PathData:
-        """Create a PathData object for a chunk of commands."""
-        # Reconstruct path data string from commands
-        path_string = self._commands_to_path_string(commands)
-        
-        # Create a new PathData with the same properties but chunked path
-        import copy
-        chunk_path_data = copy.deepcopy(original_path_data)
-        chunk_path_data.d = path_string
-        
-        return chunk_path_data
-
-    def _commands_to_path_string(self, commands: list) -> str:
-        """Convert command list back to SVG path string."""
-        path_parts = []
-        
-        for command in commands:
-            if command['type'] == 'M':
-                path_parts.append(f"M {command['x']:.2f},{command['y']:.2f}")
-            elif command['type'] == 'L':
-                path_parts.append(f"L {command['x']:.2f},{command['y']:.2f}")
-            elif command['type'] == 'H':
-                path_parts.append(f"H {command['x']:.2f}")
-            elif command['type'] == 'V':
-                path_parts.append(f"V {command['y']:.2f}")
-            elif command['type'] == 'C':
-                path_parts.append(f"C {command['x1']:.2f},{command['y1']:.2f} {command['x2']:.2f},{command['y2']:.2f} {command['x']:.2f},{command['y']:.2f}")
-            elif command['type'] == 'Z':
-                path_parts.append("Z")
-                
-        return ' '.join(path_parts)
-
-    def _generate_path_helper_method(self, path_data: PathData, method_name: str) -> str:
-        """Generate a helper method for a path chunk."""
+    def _write_path_helper_method(self, out: List[str], path_data: PathData, commands: list,
+                                  method_name: str) -> None:
+        """Write a helper method drawing a chunk of path_data's commands to out."""
         # Get colors and path parameters (similar to generate_path_code)
-        fill_opacity = getattr(path_data, 'fill_opacity', 1.0)
-        stroke_opacity = getattr(path_data, 'stroke_opacity', 1.0)
-        
-        fill_color = self._convert_color_to_compose_with_opacity(path_data.fill, fill_opacity)
-        stroke_color = self._convert_color_to_compose_with_opacity(path_data.stroke, stroke_opacity) if path_data.stroke != "none" else None
+        fill_color = self._convert_color_to_compose_with_opacity(path_data.fill, path_data.fill_opacity)
+        stroke_color = self._convert_color_to_compose_with_opacity(path_data.stroke, path_data.stroke_opacity) if path_data.stroke != "none" else None
         
         # Build path parameters
         path_params = []
@@ -209,36 +334,37 @@ private var _{icon_name}: ImageVector? = null
         else:
             param_lines = ["    path() {"]
         
-        # Generate path commands
-        path_commands = self._format_path_data(path_data.d, 2)
-        
         # Build complete method
-        method_lines = [f"private fun ImageVector.Builder.{method_name}() {{"]
-        method_lines.extend(param_lines)
-        method_lines.extend(path_commands)
-        method_lines.append("    }")
-        method_lines.append("}")
-        
-        return '\n'.join(method_lines)
+        out.append(f"private fun ImageVector.Builder.{method_name}() {{")
+        out.extend(param_lines)
+        self._format_commands(commands, 2, out)
+        out.append("    }")
+        out.append("}")
 
     def generate_path_code(self, path_data: PathData, indent_level: int = 3) -> str:
         """Generate Compose path code from PathData."""
+        path_lines = []
+        self._write_path_code(path_lines, path_data, indent_level)
+        return '\n'.join(path_lines)
+
+    def _write_path_code(self, out: List[str], path_data: PathData, indent_level: int = 3,
+                         commands: Optional[list] = None) -> None:
+        """Write Compose path code lines for PathData to out.
+        
+        Pass commands when path_data.d has already been parsed to skip parsing it again.
+        """
         if not path_data.d:
-            return ""
+            return
             
-        indent = "    " * indent_level
+        indent = _indent(indent_level)
         
         # Determine fill type
-        fill_type = "PathFillType.NonZero"
-        if path_data.fill_rule.lower() == "evenodd":
-            fill_type = "PathFillType.EvenOdd"
+        is_even_odd = path_data.fill_rule.lower() == "evenodd"
+        fill_type = "PathFillType.EvenOdd" if is_even_odd else "PathFillType.NonZero"
         
         # Convert colors with opacity
-        fill_opacity = getattr(path_data, 'fill_opacity', 1.0)
-        stroke_opacity = getattr(path_data, 'stroke_opacity', 1.0)
-        
-        fill_color = self._convert_color_to_compose_with_opacity(path_data.fill, fill_opacity)
-        stroke_color = self._convert_color_to_compose_with_opacity(path_data.stroke, stroke_opacity) if path_data.stroke != "none" else None
+        fill_color = self._convert_color_to_compose_with_opacity(path_data.fill, path_data.fill_opacity)
+        stroke_color = self._convert_color_to_compose_with_opacity(path_data.stroke, path_data.stroke_opacity) if path_data.stroke != "none" else None
         
         # Build path block with proper parameters
         path_params = []
@@ -248,7 +374,7 @@ private var _{icon_name}: ImageVector? = null
             path_params.append(f"fill = SolidColor({fill_color})")
             
         # Add fill type if not default
-        if path_data.fill_rule.lower() == "evenodd":
+        if is_even_odd:
             path_params.append(f"pathFillType = {fill_type}")
         
         # Add stroke if present
@@ -259,336 +385,228 @@ private var _{icon_name}: ImageVector? = null
         
         # Build the path opening with proper formatting
         if path_params:
-            path_lines = [f"{indent}path("]
+            param_indent = _indent(indent_level + 1)
+            out.append(f"{indent}path(")
             for i, param in enumerate(path_params):
                 # Add comma to all parameters except the last one
                 comma = "," if i < len(path_params) - 1 else ""
-                path_lines.append(f"{indent}    {param}{comma}")
-            path_lines.append(f"{indent}) {{")
+                out.append(f"{param_indent}{param}{comma}")
+            out.append(f"{indent}) {{")
         else:
-            path_lines = [f"{indent}path() {{"]
+            out.append(f"{indent}path() {{")
         
         # Add path data with proper formatting
-        formatted_path_data = self._format_path_data(path_data.d, indent_level + 1)
-        path_lines.extend(formatted_path_data)
-        
-        path_lines.append(f"{indent}}}")
+        if commands is None:
+            commands = self._parse_path_commands(path_data.d)
+        self._format_commands(commands, indent_level + 1, out)
         
-        return '\n'.join(path_lines)
+        out.append(f"{indent}}}")
 
     def generate_group_code(self, group_data: GroupData, indent_level: int = 3) -> str:
         """Generate Compose group code from GroupData."""
+        group_lines = []
+        self._write_group_code(group_lines, group_data, indent_level)
+        return '\n'.join(group_lines)
+
+    def _write_group_code(self, out: List[str], group_data: GroupData, indent_level: int = 3) -> None:
+        """Write Compose group code lines for GroupData to out."""
         if not group_data.children:
-            return ""
+            return
             
-        indent = "    " * indent_level
-        group_lines = [f"{indent}group() {{"]
+        indent = _indent(indent_level)
+        out.append(f"{indent}group() {{")
         
         # Add all child paths, applying group opacity to individual path colors
         for child in group_data.children:
             if isinstance(child, PathData):
                 # Apply group opacity to this path's colors
                 child_with_opacity = self._apply_group_opacity_to_path(child, group_data.opacity)
-                child_code = self.generate_path_code(child_with_opacity, indent_level + 1)
-                if child_code:
-                    group_lines.append(child_code)
-        
-        group_lines.append(f"{indent}}}")
+                self._write_path_code(out, child_with_opacity, indent_level + 1)
         
-        return '\n'.join(group_lines)
+        out.append(f"{indent}}}")
 
     def _apply_group_opacity_to_path(self, path_data, group_opacity: float):
         """Apply group opacity to individual path colors."""
         if group_opacity >= 1.0:
             return path_data  # No opacity change needed
         
-        # Create a copy of the path data to modify
-        import copy
-        modified_path = copy.deepcopy(path_data)
-        
-        # Apply opacity to fill color if it exists
-        if hasattr(modified_path, 'fill') and modified_path.fill != "none":
-            modified_path.fill_opacity = getattr(modified_path, 'fill_opacity', 1.0) * group_opacity
-        
-        # Apply opacity to stroke color if it exists  
-        if hasattr(modified_path, 'stroke') and modified_path.stroke != "none":
-            modified_path.stroke_opacity = getattr(modified_path, 'stroke_opacity', 1.0) * group_opacity
-            
-        return modified_path
+        has_fill = path_data.fill != "none"
+        has_stroke = path_data.stroke != "none"
+        if not has_fill and not has_stroke:
+            return path_data  # Nothing is painted, so there is nothing to fade
+        
+        # Copy the path with opacity applied to the fill and stroke colors that exist
+        return replace(
+            path_data,
+            fill_opacity=path_data.fill_opacity * group_opacity if has_fill else path_data.fill_opacity,
+            stroke_opacity=path_data.stroke_opacity * group_opacity if has_stroke else path_data.stroke_opacity
+        )
 
-    def _format_path_data(self, path_data: str, indent_level: int) -> List[str]:
-        """Format SVG path data into Compose path commands."""
-        indent = "    " * indent_level
-        lines = []
+    def _format_commands(self, commands: List[tuple], indent_level: int, out: List[str]) -> None:
+        """Format parsed path commands into Compose path commands, appending lines to out."""
+        indent = _indent(indent_level)
+        append = out.append
         
-        # Split path data into commands
-        commands = self._parse_path_commands(path_data)
+        emitters = _EMITTERS
         
         for command in commands:
-            if command['type'] == 'M':
-                lines.append(f"{indent}moveTo({command['x']:.0f}f, {command['y']:.0f}f)")
-            elif command['type'] == 'L':
-                lines.append(f"{indent}lineTo({command['x']:.0f}f, {command['y']:.0f}f)")
-            elif command['type'] == 'H':
-                if command.get('relative', False):
-                    lines.append(f"{indent}horizontalLineToRelative({command['x']:.0f}f)")
-                else:
-                    lines.append(f"{indent}horizontalLineTo({command['x']:.0f}f)")
-            elif command['type'] == 'V':
-                if command.get('relative', False):
-                    lines.append(f"{indent}verticalLineToRelative({command['y']:.0f}f)")
-                else:
-                    lines.append(f"{indent}verticalLineTo({command['y']:.0f}f)")
-            elif command['type'] == 'C':
-                lines.append(f"{indent}curveTo({command['x1']:.2f}f, {command['y1']:.2f}f, {command['x2']:.2f}f, {command['y2']:.2f}f, {command['x']:.2f}f, {command['y']:.2f}f)")
-            elif command['type'] == 'S':
-                lines.append(f"{indent}reflectiveCurveTo({command['x2']:.2f}f, {command['y2']:.2f}f, {command['x']:.2f}f, {command['y']:.2f}f)")
-            elif command['type'] == 'Q':
-                lines.append(f"{indent}quadTo({command['x1']:.2f}f, {command['y1']:.2f}f, {command['x']:.2f}f, {command['y']:.2f}f)")
-            elif command['type'] == 'T':
-                lines.append(f"{indent}reflectiveQuadTo({command['x']:.2f}f, {command['y']:.2f}f)")
-            elif command['type'] == 'A':
-                lines.append(f"{indent}arcTo({command['rx']:.2f}f, {command['ry']:.2f}f, {command['rotation']:.2f}f, {command['large_arc']}, {command['sweep']}, {command['x']:.2f}f, {command['y']:.2f}f)")
-            elif command['type'] == 'Z':
-                lines.append(f"{indent}close()")
-        
-        return lines
-
-    def _parse_path_commands(self, path_data: str) -> List[dict]:
-        """Parse SVG path data string into structured commands."""
-        commands = []
-        
-        # Normalize the path data - handle comma-separated coordinates
-        path_data = re.sub(r'\s+', ' ', path_data.strip())
-        
-        # Replace commas with spaces, but be careful with negative numbers
-        path_data = re.sub(r',', ' ', path_data)
-        
-        # Handle concatenated numbers like "125,30" -> "125 30"
-        path_data = re.sub(r'([+-]?\d*\.?\d+)([+-]\d*\.?\d+)', r'\1 \2', path_data)
-        
-        # Ensure proper spacing around path commands
-        path_data = re.sub(r'([MmLlHhVvCcSsQqTtAaZz])', r' \1 ', path_data)
-        path_data = re.sub(r'\s+', ' ', path_data.strip())
+            append(emitters[command[0]] % (indent, *command[1:]))
+
+    def _parse_path_commands(self, path_data: str) -> List[tuple]:
+        """Parse SVG path data string into structured commands.
         
-        # Split into tokens
-        tokens = path_data.split()
-        i = 0
+        Each command is a compact tuple record: an integer opcode followed by
+        its absolute coordinates, e.g. (_C, x1, y1, x2, y2, x, y) or (_Z,).
+        Relative H/V keep their offset under their own opcode, (_H_REL, dx).
+        """
+        commands = []
         current_x, current_y = 0.0, 0.0
-        
-        while i < len(tokens):
-            cmd = tokens[i].upper()
-            is_relative = tokens[i].islower()
-            i += 1
+        start_x, start_y = 0.0, 0.0
+        
+        cmd = None
+        cmd_letter = None
+        is_relative = False
+        arity = 0
+        args = []
+        
+        # One compiled pattern scans the whole string, so separators never reach
+        # Python code; a sign or second decimal point starts a new number, so
+        # compact data like "l-1.5.5-2" tokenizes correctly. Tokens come back as
+        # plain strings (no capture-group tuples); command letters are told apart
+        # from numbers by the same lookup that decodes them.
+        for token in _RE_PATH_TOKEN.findall(path_data):
+            info = _COMMAND_INFO.get(token)
+            if info is not None:
+                if args:
+                    logger.warning(f"Incomplete coordinates for {cmd_letter} command: {args}")
+                    args = []
+                
+                cmd, arity, is_relative = info
+                cmd_letter = token
+                
+                if cmd == _Z:
+                    commands.append((_Z,))
+                    # Closing a subpath moves the current point back to its start
+                    current_x, current_y = start_x, start_y
+                continue
             
-            if cmd == 'M':
-                if i + 1 < len(tokens):
-                    try:
-                        x, y = float(tokens[i]), float(tokens[i + 1])
-                        if is_relative:
-                            x += current_x
-                            y += current_y
-                        commands.append({'type': 'M', 'x': x, 'y': y})
-                        current_x, current_y = x, y
-                        i += 2
-                    except ValueError:
-                        logger.warning(f"Invalid coordinates for M command: {tokens[i:i+2]}")
-                        i += 2
-            elif cmd == 'L':
-                if i + 1 < len(tokens):
-                    try:
-                        x, y = float(tokens[i]), float(tokens[i + 1])
-                        if is_relative:
-                            x += current_x
-                            y += current_y
-                        commands.append({'type': 'L', 'x': x, 'y': y})
-                        current_x, current_y = x, y
-                        i += 2
-                    except ValueError:
-                        logger.warning(f"Invalid coordinates for L command: {tokens[i:i+2]}")
-                        i += 2
-            elif cmd == 'H':
-                if i < len(tokens):
-                    try:
-                        x = float(tokens[i])
-                        if is_relative:
-                            commands.append({'type': 'H', 'x': x, 'relative': is_relative})
-                            current_x += x
-                        else:
-                            commands.append({'type': 'H', 'x': x, 'relative': is_relative})
-                            current_x = x
-                        i += 1
-                    except ValueError:
-                        logger.warning(f"Invalid coordinate for H command: {tokens[i]}")
-                        i += 1
-            elif cmd == 'V':
-                if i < len(tokens):
-                    try:
-                        y = float(tokens[i])
-                        if is_relative:
-                            commands.append({'type': 'V', 'y': y, 'relative': is_relative})
-                            current_y += y
-                        else:
-                            commands.append({'type': 'V', 'y': y, 'relative': is_relative})
-                            current_y = y
-                        i += 1
-                    except ValueError:
-                        logger.warning(f"Invalid coordinate for V command: {tokens[i]}")
-                        i += 1
-            elif cmd == 'C':
-                if i + 5 < len(tokens):
-                    try:
-                        x1, y1 = float(tokens[i]), float(tokens[i + 1])
-                        x2, y2 = float(tokens[i + 2]), float(tokens[i + 3])
-                        x, y = float(tokens[i + 4]), float(tokens[i + 5])
-                        if is_relative:
-                            x1 += current_x
-                            y1 += current_y
-                            x2 += current_x
-                            y2 += current_y
-                            x += current_x
-                            y += current_y
-                        commands.append({'type': 'C', 'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2, 'x': x, 'y': y})
-                        current_x, current_y = x, y
-                        i += 6
-                    except ValueError:
-                        logger.warning(f"Invalid coordinates for C command: {tokens[i:i+6]}")
-                        i += 6
-            elif cmd == 'Z':
-                commands.append({'type': 'Z'})
-            else:
-                # Skip unknown commands
-                i += 1
+            if not arity:
+                logger.warning(f"Unexpected coordinate in path data: {token}")
+                continue
+            
+            # Arc flags are single '0'/'1' characters that compact writers (SVGO,
+            # Heroicons) pack without separators, e.g. "a9 9 0 0118 0", so split
+            # them off the front of the token
+            while cmd == _A and 3 <= len(args) <= 4 and len(token) > 1 and token[0] in '01':
+                args.append(float(token[0]))
+                token = token[1:]
+            
+            args.append(float(token))
+            if len(args) < arity:
+                continue
+            
+            if cmd == _M or cmd == _L:
+                x, y = args
+                if is_relative:
+                    x += current_x
+                    y += current_y
+                commands.append((cmd, x, y))
+                if cmd == _M:
+                    start_x, start_y = x, y
+                    # Additional coordinate pairs after a moveto are implicit linetos
+                    cmd = _L
+                current_x, current_y = x, y
+            elif cmd == _H:
+                x = args[0]
+                commands.append((_H_REL if is_relative else _H, x))
+                current_x = current_x + x if is_relative else x
+            elif cmd == _V:
+                y = args[0]
+                commands.append((_V_REL if is_relative else _V, y))
+                current_y = current_y + y if is_relative else y
+            elif cmd == _C:
+                x1, y1, x2, y2, x, y = args
+                if is_relative:
+                    x1 += current_x
+                    y1 += current_y
+                    x2 += current_x
+                    y2 += current_y
+                    x += current_x
+                    y += current_y
+                commands.append((_C, x1, y1, x2, y2, x, y))
+                current_x, current_y = x, y
+            elif cmd == _S:
+                x2, y2, x, y = args
+                if is_relative:
+                    x2 += current_x
+                    y2 += current_y
+                    x += current_x
+                    y += current_y
+                commands.append((_S, x2, y2, x, y))
+                current_x, current_y = x, y
+            elif cmd == _Q:
+                x1, y1, x, y = args
+                if is_relative:
+                    x1 += current_x
+                    y1 += current_y
+                    x += current_x
+                    y += current_y
+                commands.append((_Q, x1, y1, x, y))
+                current_x, current_y = x, y
+            elif cmd == _T:
+                x, y = args
+                if is_relative:
+                    x += current_x
+                    y += current_y
+                commands.append((_T, x, y))
+                current_x, current_y = x, y
+            elif cmd == _A:
+                rx, ry, rotation, large_arc, sweep, x, y = args
+                if is_relative:
+                    x += current_x
+                    y += current_y
+                commands.append((_A, rx, ry, rotation,
+                                 'true' if large_arc else 'false',
+                                 'true' if sweep else 'false', x, y))
+                current_x, current_y = x, y
+            
+            args = []
+        
+        if args:
+            logger.warning(f"Incomplete coordinates for {cmd_letter} command: {args}")
         
         return commands
 
     def _convert_color_to_compose(self, color: str) -> Optional[str]:
         """Convert SVG color to Compose Color."""
-        if not color or color.lower() == "none":
-            return None
-            
-        # Handle hex colors
-        if color.startswith("#"):
-            if len(color) == 7:  # #RRGGBB
-                return f"Color(0xFF{color[1:].upper()})"
-            elif len(color) == 4:  # #RGB
-                r, g, b = color[1], color[2], color[3]
-                return f"Color(0xFF{r}{r}{g}{g}{b}{b})"
-        
-        # Handle named colors
-        if color.lower() == "black":
-            return "Color.Black"
-        elif color.lower() == "white":
-            return "Color.White"
-        elif color.lower() == "red":
-            return "Color.Red"
-        elif color.lower() == "green":
-            return "Color.Green"
-        elif color.lower() == "blue":
-            return "Color.Blue"
-        elif color.lower() == "transparent":
-            return "Color.Transparent"
-        
-        # Default to black if can't parse
-        logger.warning(f"Unknown color format: {color}, defaulting to black")
-        return "Color.Black"
+        return _compose_color(color)
 
     def convert_to_pascal_case(self, snake_case: str) -> str:
         """Convert snake_case or kebab-case to PascalCase with Kotlin-safe naming."""
-        # Handle both snake_case, kebab-case, and other separators
-        words = re.split(r'[_\-\s\.@#\(\)\[\]]+', snake_case)
-        
-        # Clean and capitalize each word
-        clean_words = []
-        for word in words:
-            if word:
-                # Remove any remaining invalid characters and ensure alphanumeric
-                clean_word = re.sub(r'[^a-zA-Z0-9]', '', word)
-                if clean_word:
-                    # Ensure doesn't start with number
-                    if clean_word[0].isdigit():
-                        clean_word = 'Icon' + clean_word
-                    clean_words.append(clean_word.capitalize())
-        
-        # Join words and ensure result is valid
-        result = ''.join(clean_words)
-        
-        # Fallback if empty or invalid
-        if not result or not result[0].isalpha():
-            result = 'Icon' + (result if result else 'Unknown')
-        
-        # Handle Kotlin keywords
-        kotlin_keywords = {
-            'class', 'object', 'interface', 'fun', 'val', 'var', 'if', 'else', 
-            'when', 'for', 'while', 'do', 'try', 'catch', 'finally', 'return',
-            'break', 'continue', 'throw', 'import', 'package', 'as', 'is', 'in'
-        }
-        
-        if result.lower() in kotlin_keywords:
-            result = result + 'Icon'
-        
-        return result
+        return _pascal_case(snake_case)
 
     def _convert_color_to_compose_with_opacity(self, color: str, opacity: float = 1.0) -> Optional[str]:
         """Convert SVG color to Compose Color with opacity."""
-        if not color or color.lower() == "none":
-            return None
-            
-        # Get the base color
-        base_color = self._convert_color_to_compose(color)
-        if not base_color:
-            return None
-            
-        # If opacity is 1.0, return base color as-is
-        if opacity >= 1.0:
-            return base_color
-            
-        # Apply opacity to the color
-        if base_color.startswith("Color(0xFF"):
-            # Extract hex value and apply alpha
-            hex_part = base_color[10:-1]  # Remove "Color(0xFF" and ")"
-            alpha_hex = format(int(opacity * 255), '02X')
-            return f"Color(0x{alpha_hex}{hex_part})"
-        else:
-            # For named colors, use copy(alpha = x)
-            return f"{base_color}.copy(alpha = {opacity:.2f}f)"
-
-    def _to_camel_case(self, pascal_case: str) -> str:
-        """Convert PascalCase to camelCase."""
-        if not pascal_case:
-            return pascal_case
-        return pascal_case[0].lower() + pascal_case[1:]
+        return _compose_color_with_opacity(color, opacity)
 
     def _build_package_name(self, relative_path: str = None) -> str:
         """Build package name including subdirectory structure."""
         if not relative_path:
             return self.package_name
         
-        # Convert file path to package path
-        # Example: icons/actions/edit.kt -> icons.actions
-        path_parts = []
-        
-        # Get directory parts (exclude filename)
-        import os
+        # Files in the same directory share a package, so cache on the directory
         dir_path = os.path.dirname(relative_path)
-        
-        if dir_path:
-            # Split directory path and normalize for package naming
-            parts = dir_path.split(os.sep)
-            for part in parts:
-                if part:  # Skip empty parts
-                    # Normalize package segment (replace dashes with underscores, etc.)
-                    normalized_part = re.sub(r'[^a-zA-Z0-9]', '_', part.lower())
-                    if normalized_part and not normalized_part[0].isdigit():
-                        path_parts.append(normalized_part)
-        
-        if path_parts:
-            return f"{self.package_name}.{'.'.join(path_parts)}"
-        else:
+        if not dir_path:
             return self.package_name
+        
+        return _build_package_name_cached(self.package_name, dir_path)
 
     def format_kotlin_code(self, code: str) -> str:
-        """Format Kotlin code with proper indentation."""
+        """Format Kotlin code with proper indentation.
+
+        Deprecated: generate_vector_drawable no longer emits trailing
+        whitespace and does not call this. Kept for external callers.
+        """
         lines = code.split('\n')
         formatted_lines = []
         
@@ -1,22 +1,118 @@
 """File and directory processing module for SVG conversion."""
 
 import os
+import re
+import shutil
+import stat
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Dict, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for file and directory name normalization
+_RE_NON_ALNUM_RUN = re.compile(r'[^a-zA-Z0-9]+')
+_RE_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+
+# Buffer size for files streamed to disk part by part
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Flags for writing output files; O_BINARY keeps newlines untranslated on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+_KOTLIN_KEYWORDS = frozenset({
+    'class', 'interface', 'object', 'fun', 'val', 'var', 'when', 'for',
+    'while', 'do', 'if', 'else', 'try', 'catch', 'finally', 'throw',
+    'return', 'break', 'continue', 'true', 'false', 'null', 'this',
+    'super', 'is', 'in', 'as', 'package', 'import', 'typealias'
+})
+
+
+@lru_cache(maxsize=4096)
+def _filename_to_pascal_case(filename: str) -> str:
+    """Convert filename to PascalCase for Kotlin file naming."""
+    # Replace special characters with underscores, then split
+    normalized = _RE_NON_ALNUM_RUN.sub('_', filename)
+    
+    # Split by underscores and convert to PascalCase
+    words = [word for word in normalized.split('_') if word]
+    
+    # Handle edge cases
+    if not words:
+        return "Icon"
+    
+    # Convert each word to title case
+    pascal_words = []
+    for word in words:
+        if word.isdigit():
+            # If word is all digits, prefix with something
+            if not pascal_words:  # First word is digits
+                pascal_words.append("Icon" + word)
+            else:
+                pascal_words.append(word)
+        else:
+            pascal_words.append(word.capitalize())
+    
+    result = ''.join(pascal_words)
+    
+    # If filename starts with digit, prefix with Icon
+    if result and result[0].isdigit():
+        result = "Icon" + result
+    
+    # Handle Kotlin keywords
+    if result.lower() in _KOTLIN_KEYWORDS:
+        result = result + "Icon"
+    
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _normalize_directory_parts(parts: tuple) -> Path:
+    """Normalize directory path parts to match package naming convention."""
+    # Convert all directory parts to lowercase and normalize
+    normalized_parts = []
+    for part in parts:
+        if part:  # Skip empty parts
+            # Normalize package segment (replace special chars with underscores, convert to lowercase)
+            normalized_part = _RE_NON_ALNUM.sub('_', part.lower())
+            if normalized_part and not normalized_part[0].isdigit():
+                normalized_parts.append(normalized_part)
+            elif normalized_part and normalized_part[0].isdigit():
+                # If starts with digit, prefix with 'dir_'
+                normalized_parts.append('dir_' + normalized_part)
+    
+    if normalized_parts:
+        return Path(*normalized_parts)
+    else:
+        return Path('.')
+
+
+# Number of most recent error messages kept on a ConversionReport; older ones are only counted
+MAX_REPORTED_ERRORS = 100
+
 
 @dataclass
 class ConversionReport:
-    """Report of conversion process results."""
+    """Report of conversion process results.
+    
+    Memory stays bounded on large batches: errors keeps only the most recent
+    MAX_REPORTED_ERRORS messages, dropped_errors counts the older ones that
+    were discarded, and written files are logged rather than collected.
+    """
     total_files: int
     successful_conversions: int
     failed_conversions: int
-    errors: List[str]
-    output_files: List[Path]
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_REPORTED_ERRORS))
+    dropped_errors: int = 0
+
+    def add_error(self, message: str) -> None:
+        """Record an error message, counting the oldest one if it gets dropped."""
+        if len(self.errors) == self.errors.maxlen:
+            self.dropped_errors += 1
+        self.errors.append(message)
 
     @property
     def success_rate(self) -> float:
@@ -33,6 +129,14 @@ class FileProcessor:
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         
+        # Directories already created this run, so sibling files skip the mkdir syscall
+        self._created_dirs = set()
+        
+        # Scanned files sit under input_dir, so their relative paths are a plain
+        # string slice; output directories are cached per relative input directory
+        self._input_prefix = os.path.join(str(self.input_dir), '')
+        self._output_dirs: Dict[str, Path] = {}
+        
         # Validate input directory
         if not self.input_dir.exists():
             raise FileNotFoundError(f"Input directory does not exist: {self.input_dir}")
@@ -45,13 +149,15 @@ class FileProcessor:
         svg_files = []
         
         try:
-            for root, dirs, files in os.walk(scan_dir):
-                root_path = Path(root)
-                
-                for file in files:
-                    file_path = root_path / file
-                    if self.validate_svg_file(file_path):
-                        svg_files.append(file_path)
+            for entry in self._iter_svg_entries(scan_dir):
+                # DirEntry.stat() is cached by scandir and follows symlinks like Path.stat()
+                try:
+                    file_stat = entry.stat()
+                except OSError:
+                    continue  # e.g. a dangling symlink
+                file_path = Path(entry.path)
+                if self.validate_svg_file(file_path, file_stat):
+                    svg_files.append(file_path)
                         
             logger.info(f"Found {len(svg_files)} SVG files in {scan_dir}")
             return sorted(svg_files)
@@ -63,32 +169,57 @@ class FileProcessor:
             logger.error(f"Error scanning directory {scan_dir}: {e}")
             raise
 
-    def validate_svg_file(self, svg_path: Path) -> bool:
-        """Validate if file is a valid SVG file."""
+    def _iter_svg_entries(self, directory) -> Iterator[os.DirEntry]:
+        """Recursively yield directory entries whose name has an .svg extension.
+        
+        Files are filtered by name before any per-file syscall; like os.walk,
+        symlinked directories are not followed and unreadable ones are skipped.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            return
+        
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._iter_svg_entries(entry.path)
+            elif entry.name.lower().endswith('.svg'):
+                yield entry
+
+    def validate_svg_file(self, svg_path: Path, file_stat: Optional[os.stat_result] = None) -> bool:
+        """Validate if file is a valid SVG file.
+        
+        file_stat may carry an already-fetched stat result for svg_path
+        (e.g. from os.scandir) to avoid another stat syscall.
+        """
         try:
             # Check file extension
             if not svg_path.suffix.lower() == '.svg':
                 return False
                 
-            # Check if file exists and is readable
-            if not svg_path.exists() or not svg_path.is_file():
+            # Check if file exists and is a regular file, with a single stat
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(svg_path)
+                except OSError:
+                    return False
+            if not stat.S_ISREG(file_stat.st_mode):
                 return False
                 
             # Check if file is not empty
-            if svg_path.stat().st_size == 0:
+            if file_stat.st_size == 0:
                 logger.warning(f"SVG file is empty: {svg_path}")
                 return False
                 
-            # Basic SVG content validation
+            # Basic SVG content validation on raw bytes; decoding is left to the XML parser
             try:
-                with open(svg_path, 'r', encoding='utf-8') as f:
-                    content = f.read(1024)  # Read first 1KB
-                    if '<svg' not in content.lower():
-                        logger.warning(f"File doesn't appear to contain SVG content: {svg_path}")
-                        return False
-            except UnicodeDecodeError:
-                logger.warning(f"File is not valid UTF-8: {svg_path}")
-                return False
+                with open(svg_path, 'rb') as f:
+                    head = f.read(1024)  # Read first 1KB
+                if b'<svg' not in head.lower():
+                    logger.warning(f"File doesn't appear to contain SVG content: {svg_path}")
+                    return False
             except Exception as e:
                 logger.warning(f"Error reading file {svg_path}: {e}")
                 return False
@@ -113,8 +244,8 @@ class FileProcessor:
                 output_path = self.output_dir
         
         try:
-            output_path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created output directory: {output_path}")
+            self._ensure_directory(output_path)
+            logger.debug("Created output directory: %s", output_path)
             return output_path
             
         except PermissionError as e:
@@ -124,17 +255,24 @@ class FileProcessor:
             logger.error(f"Error creating directory {output_path}: {e}")
             raise
 
-    def write_kotlin_file(self, content: str, output_path: Path) -> bool:
-        """Write Kotlin content to file."""
+    def write_kotlin_file(self, content: Union[str, bytes], output_path: Path) -> bool:
+        """Write Kotlin content (text, or already UTF-8 encoded bytes) to file."""
         try:
             # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(output_path.parent)
             
-            # Write file with UTF-8 encoding
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once and write the bytes straight to the file descriptor,
+            # skipping the buffered text-file layer
+            data = content.encode('utf-8') if isinstance(content, str) else content
+            fd = os.open(output_path, _WRITE_FLAGS, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
                 
-            logger.debug(f"Successfully wrote Kotlin file: {output_path}")
+            logger.debug("Successfully wrote Kotlin file: %s", output_path)
             return True
             
         except PermissionError as e:
@@ -144,23 +282,66 @@ class FileProcessor:
             logger.error(f"Error writing file {output_path}: {e}")
             return False
 
+    def write_kotlin_parts(self, parts: Iterable[str], output_path: Path) -> bool:
+        """Write Kotlin content given as consecutive text parts to file.
+        
+        The parts are streamed through a large write buffer, so the whole file
+        never has to exist as one string or one encoded bytes object.
+        """
+        try:
+            # Ensure output directory exists
+            self._ensure_directory(output_path.parent)
+            
+            # newline='' writes '\n' untranslated, like write_kotlin_file
+            with open(output_path, 'w', encoding='utf-8', newline='',
+                      buffering=_STREAM_BUFFER_SIZE) as f:
+                f.writelines(parts)
+                
+            logger.debug("Successfully wrote Kotlin file: %s", output_path)
+            return True
+            
+        except PermissionError as e:
+            logger.error(f"Permission denied writing file {output_path}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error writing file {output_path}: {e}")
+            return False
+
+    def _ensure_directory(self, dir_path: Path) -> None:
+        """Create a directory (and parents) once per run."""
+        if dir_path in self._created_dirs:
+            return
+        dir_path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(dir_path)
+
+    def get_relative_path(self, input_svg_path: Path) -> str:
+        """Return input_svg_path relative to the input directory, as a string.
+        
+        Raises ValueError if the path is not inside the input directory.
+        """
+        path_str = str(input_svg_path)
+        if path_str.startswith(self._input_prefix):
+            return path_str[len(self._input_prefix):]
+        return str(input_svg_path.relative_to(self.input_dir))
+
     def get_output_path(self, input_svg_path: Path) -> Path:
         """Generate output Kotlin file path from input SVG path."""
         try:
             # Calculate relative path from input directory
-            relative_path = input_svg_path.relative_to(self.input_dir)
+            relative_dir, filename = os.path.split(self.get_relative_path(input_svg_path))
             
             # Convert filename to PascalCase (proper Kotlin convention)
-            pascal_case_name = self._convert_to_pascal_case(relative_path.stem)
+            pascal_case_name = self._convert_to_pascal_case(os.path.splitext(filename)[0])
             kotlin_filename = pascal_case_name + '.kt'
             
             # Normalize directory structure to match package naming convention
-            normalized_dir_path = self._normalize_directory_path(relative_path.parent)
+            output_dir = self._output_dirs.get(relative_dir)
+            if output_dir is None:
+                normalized_dir_path = self._normalize_directory_path(Path(relative_dir))
+                output_dir = self._output_dirs[relative_dir] = self.output_dir / normalized_dir_path
             
             # Build full output path
-            output_path = self.output_dir / normalized_dir_path / kotlin_filename
-            
-            return output_path
+            return output_dir / kotlin_filename
             
         except ValueError:
             # Fallback if input_svg_path is not relative to input_dir
@@ -170,73 +351,15 @@ class FileProcessor:
 
     def _convert_to_pascal_case(self, filename: str) -> str:
         """Convert filename to PascalCase for Kotlin file naming."""
-        # Import here to avoid circular imports
-        import re
-        
-        # Replace special characters with underscores, then split
-        normalized = re.sub(r'[^a-zA-Z0-9]+', '_', filename)
-        
-        # Split by underscores and convert to PascalCase
-        words = [word for word in normalized.split('_') if word]
-        
-        # Handle edge cases
-        if not words:
-            return "Icon"
-        
-        # Convert each word to title case
-        pascal_words = []
-        for word in words:
-            if word.isdigit():
-                # If word is all digits, prefix with something
-                if not pascal_words:  # First word is digits
-                    pascal_words.append("Icon" + word)
-                else:
-                    pascal_words.append(word)
-            else:
-                pascal_words.append(word.capitalize())
-        
-        result = ''.join(pascal_words)
-        
-        # If filename starts with digit, prefix with Icon
-        if result and result[0].isdigit():
-            result = "Icon" + result
-        
-        # Handle Kotlin keywords
-        kotlin_keywords = {
-            'class', 'interface', 'object', 'fun', 'val', 'var', 'when', 'for',
-            'while', 'do', 'if', 'else', 'try', 'catch', 'finally', 'throw',
-            'return', 'break', 'continue', 'true', 'false', 'null', 'this',
-            'super', 'is', 'in', 'as', 'package', 'import', 'typealias'
-        }
-        
-        if result.lower() in kotlin_keywords:
-            result = result + "Icon"
-        
-        return result
+        return _filename_to_pascal_case(filename)
 
     def _normalize_directory_path(self, dir_path: Path) -> Path:
         """Normalize directory path to match package naming convention."""
-        import re
-        
-        if not dir_path or str(dir_path) == '.':
+        if not dir_path:
             return Path('.')
         
-        # Convert all directory parts to lowercase and normalize
-        normalized_parts = []
-        for part in dir_path.parts:
-            if part:  # Skip empty parts
-                # Normalize package segment (replace special chars with underscores, convert to lowercase)
-                normalized_part = re.sub(r'[^a-zA-Z0-9]', '_', part.lower())
-                if normalized_part and not normalized_part[0].isdigit():
-                    normalized_parts.append(normalized_part)
-                elif normalized_part and normalized_part[0].isdigit():
-                    # If starts with digit, prefix with 'dir_'
-                    normalized_parts.append('dir_' + normalized_part)
-        
-        if normalized_parts:
-            return Path(*normalized_parts)
-        else:
-            return Path('.')
+        # Sibling files share a directory, so the normalization is cached on its parts
+        return _normalize_directory_parts(dir_path.parts)
 
     def clean_output_directory(self, confirm: bool = False) -> bool:
         """Clean output directory of existing files."""
@@ -244,18 +367,21 @@ class FileProcessor:
             logger.warning("clean_output_directory called without confirmation")
             return False
             
+        # Removed directories must be recreated on the next write
+        self._created_dirs.clear()
+            
         try:
             if self.output_dir.exists():
-                for item in self.output_dir.rglob('*'):
-                    if item.is_file():
-                        item.unlink()
-                        logger.debug(f"Removed file: {item}")
-                        
-                # Remove empty directories
-                for item in sorted(self.output_dir.rglob('*'), reverse=True):
-                    if item.is_dir() and not any(item.iterdir()):
-                        item.rmdir()
-                        logger.debug(f"Removed empty directory: {item}")
+                # Remove the directory's contents but keep the directory itself;
+                # rmtree deletes each subtree in a single pass
+                with os.scandir(self.output_dir) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                            logger.debug(f"Removed directory: {entry.path}")
+                        else:
+                            os.unlink(entry.path)
+                            logger.debug(f"Removed file: {entry.path}")
                         
                 logger.info(f"Cleaned output directory: {self.output_dir}")
                 return True
@@ -309,7 +435,6 @@ class FileProcessor:
                 counter += 1
                 
             # Copy file to backup
-            import shutil
             shutil.copy2(file_path, backup_path)
             logger.debug(f"Created backup: {backup_path}")
             return backup_path
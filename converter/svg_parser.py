@@ -1,16 +1,90 @@
 """SVG parsing module for extracting data from SVG files."""
 
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Pattern
 import re
+import sys
 import logging
 
+# Prefer lxml's libxml2-based parser when installed; the ElementTree API used here
+# (iter, get, attrib, text, tag) is shared by both
+try:
+    from lxml import etree as ET
+    _XML_PARSER = ET.XMLParser(remove_comments=True, remove_pis=True, resolve_entities=False)
+    _XML_PARSE_ERROR = ET.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+    _XML_PARSE_ERROR = ET.ParseError
+
 logger = logging.getLogger(__name__)
 
+# One instance per SVG element, so drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Unit suffixes stripped from width/height, most common first ('rem' before 'em')
+_DIMENSION_UNITS = ('px', 'pt', 'rem', 'em', '%')
+
+# Precompiled patterns for color and path data normalization
+_RE_RGB = re.compile(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)')
+_RE_PATH_COMMAND = re.compile(r'([MmLlHhVvCcSsQqTtAaZz])')
+
+# Named SVG colors mapped to their normalized form
+_NAMED_COLORS = {
+    "none": "none",
+    "black": "#000000",
+    "white": "#ffffff",
+    "red": "#ff0000",
+    "green": "#008000",
+    "blue": "#0000ff",
+    "transparent": "none",
+}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_color(color: str) -> str:
+    """Normalize an SVG color value to standard format.
+    
+    Icon sets repeat a handful of colors across every path, so results are cached
+    and interned, keeping one string object per distinct color.
+    """
+    if not color:
+        return "none"
+    
+    # Handle named colors (including "none")
+    named_color = _NAMED_COLORS.get(color.lower())
+    if named_color:
+        return named_color
+        
+    # Handle hex colors
+    if color[0] == "#":
+        return sys.intern(color.upper())
+        
+    # Handle rgb/rgba colors - convert to hex
+    rgb_match = _RE_RGB.match(color)
+    if rgb_match:
+        r, g, b = map(int, rgb_match.groups())
+        return sys.intern(f"#{r:02X}{g:02X}{b:02X}")
+        
+    return sys.intern(color)
+
+
+# A '.className { properties }' rule; the lookahead only consumes the dot so
+# every rule is seen, exactly as a per-class search would see it
+_RE_CSS_CLASS_RULE = re.compile(r'\.(?=([\w-]+)\s*\{([^}]+)\})')
+_RE_CSS_CLASS_NAME = re.compile(r'[\w-]+')
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _css_class_pattern(class_name: str) -> Pattern:
+    """Compile the pattern matching a '.className { properties }' CSS rule."""
+    return re.compile(fr'\.{re.escape(class_name)}\s*\{{([^}}]+)\}}')
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ViewBox:
     """Represents SVG viewBox dimensions."""
     x: float
@@ -32,7 +106,7 @@ class ViewBox:
             return cls(0, 0, 24, 24)  # Default fallback
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PathData:
     """Represents SVG path element data."""
     d: str
@@ -42,59 +116,32 @@ class PathData:
     fill_rule: str = "nonzero"
     opacity: float = 1.0
     transform: Optional[str] = None
+    fill_opacity: float = 1.0
+    stroke_opacity: float = 1.0
 
     def __post_init__(self):
         """Normalize and validate path data after initialization."""
-        self.fill = self._normalize_color(self.fill)
-        self.stroke = self._normalize_color(self.stroke)
+        self.fill = _normalize_color(self.fill)
+        self.stroke = _normalize_color(self.stroke)
+        self.fill_rule = sys.intern(self.fill_rule)
         
-    def _normalize_color(self, color: str) -> str:
+    @staticmethod
+    def _normalize_color(color: str) -> str:
         """Normalize color values to standard format."""
-        if not color or color.lower() == "none":
-            return "none"
-        
-        # Handle named colors
-        named_colors = {
-            "black": "#000000",
-            "white": "#ffffff", 
-            "red": "#ff0000",
-            "green": "#008000",
-            "blue": "#0000ff",
-            "transparent": "none"
-        }
-        
-        color_lower = color.lower()
-        if color_lower in named_colors:
-            return named_colors[color_lower]
-            
-        # Handle hex colors
-        if color.startswith("#"):
-            return color.upper()
-            
-        # Handle rgb/rgba colors - convert to hex
-        rgb_match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)', color)
-        if rgb_match:
-            r, g, b = map(int, rgb_match.groups())
-            return f"#{r:02X}{g:02X}{b:02X}"
-            
-        return color
+        return _normalize_color(color)
 
 
-@dataclass 
+@dataclass(**_DATACLASS_OPTIONS)
 class GroupData:
     """Represents SVG group element data."""
     transform: Optional[str] = None
     opacity: float = 1.0
     fill: str = "black"
     stroke: str = "none"
-    children: List[Any] = None
-
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
+    children: List[Any] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SVGData:
     """Complete SVG file data."""
     width: float
@@ -120,26 +167,28 @@ class SVGParser:
             'svg': 'http://www.w3.org/2000/svg',
             'xlink': 'http://www.w3.org/1999/xlink'
         }
+        # Class rules of the most recently styled document, see _css_class_rules
+        self._css_rules_root = None
+        self._css_rules: Dict[str, Dict[str, str]] = {}
 
     def parse_svg_file(self, svg_path: Path) -> SVGData:
         """Parse an SVG file and extract all relevant data."""
         try:
-            tree = ET.parse(svg_path)
+            tree = ET.parse(str(svg_path), parser=_XML_PARSER)
             root = tree.getroot()
             
             # Store root for CSS class resolution
             self._current_root = root
             
-            # Remove namespace prefixes for easier parsing
-            self._remove_namespace_prefixes(root)
+            # Remove namespace prefixes and collect convertible elements in one pass
+            elements, group_paths = self._collect_elements(root)
             
             # Extract basic SVG attributes
             width, height = self._extract_dimensions(root)
             viewbox = self.extract_viewbox(root)
             
             # Extract paths and groups
-            paths = self.extract_paths(root)
-            groups = self.extract_groups(root)
+            paths, groups = self._extract_shapes(elements, group_paths)
             
             return SVGData(
                 width=width,
@@ -150,19 +199,83 @@ class SVGParser:
                 filename=svg_path.stem
             )
             
-        except ET.ParseError as e:
+        except _XML_PARSE_ERROR as e:
             logger.error(f"Failed to parse SVG file {svg_path}: {e}")
             raise
         except Exception as e:
             logger.error(f"Unexpected error parsing {svg_path}: {e}")
             raise
 
-    def _remove_namespace_prefixes(self, element):
-        """Remove namespace prefixes from element tags recursively."""
-        if '}' in element.tag:
-            element.tag = element.tag.split('}')[1]
-        for child in element:
-            self._remove_namespace_prefixes(child)
+    def _collect_elements(self, root) -> tuple[Dict[str, list], Dict[Any, list]]:
+        """Remove namespace prefixes and bucket shape and group elements by tag.
+        
+        A single depth-first walk replaces the separate namespace pass, the
+        per-tag searches and the per-group path searches; each bucket keeps
+        document order. Returns the buckets keyed by tag, and a mapping from
+        each group element to the path elements nested anywhere below it.
+        """
+        elements = {'path': [], 'polygon': [], 'polyline': [], 'g': []}
+        group_paths = {}
+        
+        # Explicit stack rather than recursion so deeply nested files are safe;
+        # each entry carries the path lists of its enclosing groups
+        stack = [(root, ())]
+        while stack:
+            element, enclosing = stack.pop()
+            tag = element.tag
+            # lxml gives non-element nodes (e.g. unresolved entities) a non-string tag
+            if not isinstance(tag, str):
+                continue
+            if '}' in tag:
+                tag = tag.rsplit('}', 1)[1]
+                element.tag = tag
+            bucket = elements.get(tag)
+            if bucket is not None:
+                bucket.append(element)
+                if tag == 'path':
+                    for nested_paths in enclosing:
+                        nested_paths.append(element)
+                elif tag == 'g':
+                    nested_paths = group_paths[element] = []
+                    enclosing += (nested_paths,)
+            if len(element):
+                stack.extend([(child, enclosing) for child in reversed(element)])
+        
+        return elements, group_paths
+
+    def _extract_shapes(self, elements: Dict[str, list],
+                        group_paths: Dict[Any, list]) -> tuple[List[PathData], List[GroupData]]:
+        """Build paths and groups from the elements collected by _collect_elements.
+        
+        Each path element is parsed once; groups reuse the parsed result for
+        their descendant paths.
+        """
+        paths = []
+        parsed_paths = {}
+        
+        for path_elem in elements['path']:
+            path_data = self._parse_path_element(path_elem)
+            parsed_paths[path_elem] = path_data
+            if path_data:
+                paths.append(path_data)
+        
+        # Polygons and polylines follow all path elements, converted to paths
+        for polygon_elem in elements['polygon']:
+            path_data = self._parse_polygon_element(polygon_elem)
+            if path_data:
+                paths.append(path_data)
+        
+        for polyline_elem in elements['polyline']:
+            path_data = self._parse_polyline_element(polyline_elem)
+            if path_data:
+                paths.append(path_data)
+        
+        groups = []
+        for group_elem in elements['g']:
+            children = [parsed_paths[path_elem] for path_elem in group_paths[group_elem]]
+            groups.append(self._build_group(group_elem, [child for child in children if child]))
+        
+        return paths, groups
 
     def _extract_dimensions(self, root) -> tuple[float, float]:
         """Extract width and height from SVG root element."""
@@ -179,7 +292,11 @@ class SVGParser:
         """Parse dimension string removing units."""
         try:
             # Remove common units
-            dimension_str = re.sub(r'(px|pt|em|rem|%)', '', dimension_str.strip())
+            dimension_str = dimension_str.strip()
+            for unit in _DIMENSION_UNITS:
+                if dimension_str.endswith(unit):
+                    dimension_str = dimension_str[:-len(unit)]
+                    break
             return float(dimension_str)
         except (ValueError, TypeError):
             logger.warning(f"Failed to parse dimension '{dimension_str}', using default 24")
@@ -314,6 +431,10 @@ class SVGParser:
             if path_data:
                 children.append(path_data)
         
+        return self._build_group(group_elem, children)
+
+    def _build_group(self, group_elem, children: List[PathData]) -> GroupData:
+        """Create GroupData from a group element and its parsed child paths."""
         return GroupData(
             transform=group_elem.get('transform'),
             opacity=float(group_elem.get('opacity', '1')),
@@ -324,47 +445,32 @@ class SVGParser:
 
     def normalize_colors(self, color: str) -> str:
         """Normalize color string to standard format."""
-        return PathData._normalize_color(PathData(), color)
+        return _normalize_color(color)
 
     def parse_path_data(self, path_string: str) -> str:
         """Parse and normalize SVG path data string."""
-        # Remove extra whitespace and normalize commands
-        path_string = re.sub(r'\s+', ' ', path_string.strip())
+        # Ensure proper spacing around path commands, then collapse whitespace
+        # runs (including the ones just added) in a single split/join
+        path_string = _RE_PATH_COMMAND.sub(r' \1 ', path_string)
         
-        # Ensure proper spacing around path commands
-        path_string = re.sub(r'([MmLlHhVvCcSsQqTtAaZz])', r' \1 ', path_string)
-        path_string = re.sub(r'\s+', ' ', path_string.strip())
-        
-        return path_string
+        return ' '.join(path_string.split())
 
     def _points_to_path_data(self, points_str: str, close_path: bool = True) -> str:
         """Convert SVG points string to path data."""
         # Handle both comma and space separated coordinates
-        # Replace commas between coordinate pairs with spaces
-        points_str = re.sub(r',', ' ', points_str.strip())
-        
-        # Split into coordinate pairs
-        coords = []
-        values = [float(x) for x in points_str.split() if x]
-        
-        # Group coordinates into pairs
-        for i in range(0, len(values), 2):
-            if i + 1 < len(values):
-                coords.append((values[i], values[i + 1]))
-        
-        if not coords:
+        values = list(map(float, points_str.replace(',', ' ').split()))
+        if len(values) < 2:
             return ""
         
-        # Build path data string
-        path_parts = [f"M {coords[0][0]} {coords[0][1]}"]
-        
-        for x, y in coords[1:]:
-            path_parts.append(f"L {x} {y}")
+        # Pair coordinates up (a trailing odd value is dropped) and emit
+        # "M x y L x y ..." in a single join
+        coords = iter(values[:len(values) & ~1])
+        path_data = "M " + " L ".join(map("%r %r".__mod__, zip(coords, coords)))
         
         if close_path:
-            path_parts.append("Z")
+            path_data += " Z"
         
-        return " ".join(path_parts)
+        return path_data
 
     def _extract_style_attributes(self, element) -> tuple[str, str, float, float]:
         """Extract style attributes from element, handling CSS classes."""
@@ -430,13 +536,17 @@ class SVGParser:
             # This is a simplified approach - in practice we'll use the stored root
             pass
         
+        # Simple CSS parsing - look for .className { properties }
+        if _RE_CSS_CLASS_NAME.fullmatch(class_name):
+            return self._css_class_rules(root).get(class_name)
+        
+        # Unusual class names are not in the rule table; search for them directly
+        class_pattern = _css_class_pattern(class_name)
+        
         # Look for style elements
         for style_elem in root.iter('style'):
             style_text = style_elem.text or ""
-            
-            # Simple CSS parsing - look for .className { properties }
-            class_pattern = fr'\.{re.escape(class_name)}\s*\{{([^}}]+)\}}'
-            match = re.search(class_pattern, style_text)
+            match = class_pattern.search(style_text)
             
             if match:
                 properties_text = match.group(1)
@@ -444,6 +554,24 @@ class SVGParser:
         
         return None
 
+    def _css_class_rules(self, root) -> Dict[str, Dict[str, str]]:
+        """Map class names to parsed properties for all style elements under root.
+        
+        Built once per document, so elements sharing a class do not rescan the
+        style sheets; the first rule for a class wins.
+        """
+        if self._css_rules_root is not root:
+            rules = {}
+            for style_elem in root.iter('style'):
+                for match in _RE_CSS_CLASS_RULE.finditer(style_elem.text or ""):
+                    class_name = match.group(1)
+                    if class_name not in rules:
+                        rules[class_name] = self._parse_css_properties(match.group(2))
+            self._css_rules_root = root
+            self._css_rules = rules
+        
+        return self._css_rules
+
     def _parse_css_properties(self, properties_text: str) -> Dict[str, str]:
         """Parse CSS properties from text."""
         properties = {}
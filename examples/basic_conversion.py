@@ -9,6 +9,16 @@ It converts the example SVG icons to Kotlin Compose ImageVectors.
 import os
 import sys
 import subprocess
+from pathlib import Path
+
+# Run the converter in-process when main.py is importable from the project
+# root; otherwise each run falls back to a subprocess
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from main import main as converter_main
+except ImportError:
+    converter_main = None
+
 
 def main():
     """Run basic conversion example."""
@@ -39,8 +49,7 @@ def main():
     
     # Run the converter
     try:
-        cmd = [
-            sys.executable, main_script,
+        converter_args = [
             "--input", input_dir,
             "--output", output_dir,
             "--package", "com.example.icons",
@@ -51,21 +60,29 @@ def main():
         ]
         
         print("🚀 Running conversion...")
-        print(f"Command: {' '.join(cmd)}")
+        print(f"Command: {' '.join([sys.executable, main_script] + converter_args)}")
         print()
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if converter_main is None:
+            subprocess.run([sys.executable, main_script] + converter_args,
+                           check=True, capture_output=True, text=True)
+        else:
+            # The converter always finishes with sys.exit
+            try:
+                converter_main(converter_args)
+            except SystemExit as e:
+                if e.code:
+                    print(f"❌ Conversion failed with exit code {e.code}")
+                    return False
         
+        print()
         print("✅ Conversion completed successfully!")
         print()
         print("📋 Generated files:")
         
         # List generated files
-        for root, dirs, files in os.walk(output_dir):
-            for file in files:
-                if file.endswith('.kt'):
-                    rel_path = os.path.relpath(os.path.join(root, file), output_dir)
-                    print(f"   📄 {rel_path}")
+        for kotlin_file in Path(output_dir).rglob('*.kt'):
+            print(f"   📄 {kotlin_file.relative_to(output_dir)}")
         
         print()
         print("🎯 Usage in your Compose app:")
@@ -10,6 +10,16 @@ import os
 import sys
 import json
 import subprocess
+from pathlib import Path
+
+# Run the converter in-process when main.py is importable from the project
+# root; otherwise each run falls back to a subprocess
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from main import main as converter_main
+except ImportError:
+    converter_main = None
+
 
 def create_example_config():
     """Create an example configuration file."""
@@ -66,27 +76,33 @@ def main():
     
     # Run the converter with config file
     try:
-        cmd = [
-            sys.executable, main_script,
-            "--config", config_path
-        ]
+        converter_args = ["--config", config_path]
         
         print("🚀 Running conversion with config file...")
-        print(f"Command: {' '.join(cmd)}")
+        print(f"Command: {' '.join([sys.executable, main_script] + converter_args)}")
         print()
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if converter_main is None:
+            subprocess.run([sys.executable, main_script] + converter_args,
+                           check=True, capture_output=True, text=True)
+        else:
+            # The converter always finishes with sys.exit
+            try:
+                converter_main(converter_args)
+            except SystemExit as e:
+                if e.code:
+                    print(f"❌ Conversion failed with exit code {e.code}")
+                    return False
         
+        print()
         print("✅ Conversion completed successfully!")
         print()
         print("📋 Generated files:")
         
         # List generated files
-        for root, dirs, files in os.walk(config["output"]):
-            for file in files:
-                if file.endswith('.kt'):
-                    rel_path = os.path.relpath(os.path.join(root, file), config["output"])
-                    print(f"   📄 {rel_path}")
+        output_dir = Path(config["output"])
+        for kotlin_file in output_dir.rglob('*.kt'):
+            print(f"   📄 {kotlin_file.relative_to(output_dir)}")
         
         print()
         print("🎯 Usage in your Compose app:")
@@ -2,14 +2,53 @@
 
 import argparse
 import logging
+import os
 import sys
 import re
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from converter import SVGParser, ComposeGenerator, FileProcessor, ConversionReport
 
+# Batches smaller than this are converted in-process, where pool startup would dominate
+PARALLEL_MIN_FILES = 64
+
+# Upper bound on files handed to a worker per round trip; keeps progress output responsive
+PARALLEL_MAX_CHUNKSIZE = 16
+
+# In-process conversions hand file writes to a few threads so disk latency overlaps
+# with generating the next file; past this many in-flight writes generation waits
+WRITER_THREADS = 4
+MAX_PENDING_WRITES = 256
+
+# Threads reading generated files back for the IconPack; the work is I/O latency,
+# so more threads than cores pay off
+ICONPACK_READER_THREADS = min(32, 4 * (os.cpu_count() or 1))
+
+# Generated files declare their ImageVector right after the imports, so only this
+# many leading characters are read unless the declaration is not found there
+ICONPACK_HEAD_CHARS = 4096
+
+# Threads listing directories when counting SVG files in interactive mode; capped
+# so spinning disks are not made to seek between too many directories at once
+SVG_COUNT_THREADS = 8
+
+# Minimum seconds between progress line redraws (25 Hz); the final count is always shown
+PROGRESS_INTERVAL = 0.04
+
+# Precompiled patterns for icon pack scanning and package name validation
+_RE_ICON_VAL = re.compile(r'val (\w+): ImageVector')
+_RE_PACKAGE_NAME = re.compile(r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$')
+_RE_PACKAGE_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_.]')
+
+# IconPack generation holds one IconEntry per icon, so drop the per-instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class ConverterConfig:
@@ -22,6 +61,15 @@ class ConverterConfig:
     clean_output: bool = False
     generate_index: bool = False
     iconpack_name: str = "Icons"
+    jobs: Optional[int] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class IconEntry:
+    """An icon listed in the generated IconPack."""
+    name: str
+    path: Path
+    variable_name: str
 
 
 class SVGToComposeConverter:
@@ -33,6 +81,10 @@ class SVGToComposeConverter:
         self.generator = ComposeGenerator(config.package_name)
         self.file_processor = FileProcessor(config.input_dir, config.output_dir)
         
+        # Variable names declared by the files convert_all wrote, keyed by output
+        # path, so IconPack generation does not have to read them back
+        self._icon_variable_names: Dict[Path, Optional[str]] = {}
+        
         # Setup logging
         self._setup_logging()
         
@@ -65,47 +117,55 @@ class SVGToComposeConverter:
         
         if not svg_files:
             self.logger.warning("No SVG files found in input directory")
-            return ConversionReport(0, 0, 0, ["No SVG files found"], [])
+            report = ConversionReport(0, 0, 0)
+            report.add_error("No SVG files found")
+            return report
+        
+        self._icon_variable_names.clear()
         
         # Initialize report
         report = ConversionReport(
             total_files=len(svg_files),
             successful_conversions=0,
-            failed_conversions=0,
-            errors=[],
-            output_files=[]
+            failed_conversions=0
         )
         
         # Process each SVG file
-        for i, svg_path in enumerate(svg_files, 1):
-            progress_percent = (i / len(svg_files)) * 100
-            
+        total_files = len(svg_files)
+        last_progress = 0.0
+        for i, (svg_path, output_path, success) in enumerate(self._convert_files(svg_files), 1):
             if not self.config.verbose:
-                # Simple progress for non-verbose mode
-                print(f"\r🔄 Converting: {i}/{len(svg_files)} ({progress_percent:.1f}%) - {svg_path.name[:50]}{'...' if len(svg_path.name) > 50 else ''}", end='', flush=True)
+                # Simple progress for non-verbose mode, redrawn at most every
+                # PROGRESS_INTERVAL seconds to keep terminal writes off the hot path
+                now = time.monotonic()
+                if i == total_files or now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    progress_percent = (i / total_files) * 100
+                    name = svg_path.name
+                    display_name = name if len(name) <= 50 else name[:50] + '...'
+                    print(f"\r🔄 Converting: {i}/{total_files} ({progress_percent:.1f}%) - {display_name}", end='', flush=True)
             else:
-                self.logger.info(f"Processing {svg_path.name} ({i}/{len(svg_files)} - {progress_percent:.1f}%)")
+                progress_percent = (i / total_files) * 100
+                self.logger.info(f"Processed {svg_path.name} ({i}/{total_files} - {progress_percent:.1f}%)")
             
             try:
-                success = self.convert_single_file(svg_path)
-                
                 if success:
                     report.successful_conversions += 1
-                    output_path = self.file_processor.get_output_path(svg_path)
-                    report.output_files.append(output_path)
+                    if output_path is not None:
+                        self._record_icon_variable_name(svg_path, output_path)
                     if self.config.verbose:
                         self.logger.info(f"✓ Successfully converted {svg_path.name}")
                 else:
                     report.failed_conversions += 1
                     error_msg = f"Failed to convert {svg_path.name}"
-                    report.errors.append(error_msg)
+                    report.add_error(error_msg)
                     if self.config.verbose:
                         self.logger.error(f"✗ {error_msg}")
                     
             except Exception as e:
                 report.failed_conversions += 1
                 error_msg = f"Error converting {svg_path.name}: {str(e)}"
-                report.errors.append(error_msg)
+                report.add_error(error_msg)
                 if self.config.verbose:
                     self.logger.error(f"✗ {error_msg}")
         
@@ -118,47 +178,175 @@ class SVGToComposeConverter:
         
         return report
 
-    def convert_single_file(self, svg_path: Path) -> bool:
-        """Convert a single SVG file to Compose ImageVector."""
-        try:
-            # Parse SVG file
-            self.logger.debug(f"Parsing SVG file: {svg_path}")
-            svg_data = self.parser.parse_svg_file(svg_path)
-            
-            # Generate class name from filename
-            class_name = svg_path.stem
-            
-            # Get relative path from input directory for package structure
-            relative_path = svg_path.relative_to(self.config.input_dir)
+    def _convert_files(self, svg_files: List[Path]) -> Iterator[Tuple[Path, Optional[Path], bool]]:
+        """Convert files, yielding (svg_path, output_path, success) in input order.
+        
+        output_path is None for dry runs. Each file is independent and
+        conversion is CPU-bound, so larger batches are spread over a process
+        pool to sidestep the GIL. The pool has config.jobs workers (CPU count
+        by default); one job disables it.
+        """
+        # Output paths are derived once here and handed on to the writers,
+        # the workers and the caller
+        if self.config.dry_run:
+            output_paths = [None] * len(svg_files)
+            groups = [[i] for i in range(len(svg_files))]
+        else:
+            output_paths = [self.file_processor.get_output_path(svg_path) for svg_path in svg_files]
+            groups = self._group_by_output_path(svg_files, output_paths)
+        
+        workers = self.config.jobs or os.cpu_count() or 1
+        if len(svg_files) < PARALLEL_MIN_FILES or workers < 2:
+            yield from self._convert_files_in_process(svg_files, output_paths)
+            return
+        
+        # Inputs sharing an output file go to one worker as a single task, so they
+        # are written in input order instead of racing across processes
+        tasks = [tuple((svg_files[i], output_paths[i]) for i in group) for group in groups]
+        
+        # Hand out files in chunks to amortize IPC, while leaving several chunks
+        # per worker so uneven file sizes still balance out
+        chunksize = max(1, min(PARALLEL_MAX_CHUNKSIZE, len(tasks) // (workers * 4)))
+        
+        self.logger.debug(f"Converting {len(svg_files)} files with {workers} worker processes "
+                          f"(chunksize {chunksize})")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            # Tasks come back ordered by their first file; a group's later files
+            # are held until every file before them has been reported
+            results = {}
+            next_index = 0
+            for group, group_results in zip(groups, executor.map(_convert_group_in_worker, tasks,
+                                                                 chunksize=chunksize)):
+                results.update(zip(group, group_results))
+                while next_index in results:
+                    yield svg_files[next_index], output_paths[next_index], results.pop(next_index)
+                    next_index += 1
+
+    def _group_by_output_path(self, svg_files: List[Path], output_paths: List[Path]) -> List[List[int]]:
+        """Group input indices by the output file they convert to.
+        
+        Groups are ordered by their first index. Inputs that collide (e.g.
+        ic-x.svg and ic_x.svg both become IcX.kt) are logged; the last one in
+        input order is the file that ends up written.
+        """
+        groups: Dict[Path, List[int]] = {}
+        for i, output_path in enumerate(output_paths):
+            groups.setdefault(output_path, []).append(i)
+        
+        for output_path, indices in groups.items():
+            if len(indices) > 1:
+                names = ', '.join(svg_files[i].name for i in indices)
+                self.logger.warning(f"{names} convert to the same file {output_path}; "
+                                    f"keeping {svg_files[indices[-1]].name}")
+        
+        return list(groups.values())
+
+    def _convert_files_in_process(self, svg_files: List[Path],
+                                  output_paths: List[Optional[Path]]) -> Iterator[Tuple[Path, Optional[Path], bool]]:
+        """Convert files in this process, writing output on background threads.
+        
+        Results are still yielded in input order; a file is reported once its
+        write has finished.
+        """
+        with ThreadPoolExecutor(max_workers=WRITER_THREADS) as writer:
+            pending = deque()
+            # Unfinished write per output path; inputs that map to the same file
+            # are written one after another in input order, so the last one wins
+            in_flight: Dict[Path, Future] = {}
             
-            # Generate Kotlin code
-            self.logger.debug(f"Generating Kotlin code for: {class_name}")
-            kotlin_code = self.generator.generate_vector_drawable(svg_data, class_name, str(relative_path))
+            for svg_path, output_path in zip(svg_files, output_paths):
+                try:
+                    kotlin_code = self._generate_kotlin_code(svg_path)
+                except Exception as e:
+                    self.logger.error(f"Error converting {svg_path}: {e}")
+                    result = False
+                else:
+                    if output_path is None:  # dry run, nothing to write
+                        result = True
+                    else:
+                        previous = in_flight.get(output_path)
+                        if previous is not None:
+                            previous.result()
+                        result = in_flight[output_path] = writer.submit(
+                            self._write_kotlin_file, kotlin_code, output_path)
+                pending.append((svg_path, output_path, result))
+                
+                # Report files whose writes are done (or, when too many are in
+                # flight, wait for the oldest) without stalling on the rest
+                while pending and (len(pending) > MAX_PENDING_WRITES
+                                   or not isinstance(pending[0][2], Future)
+                                   or pending[0][2].done()):
+                    done_path, done_output, done_result = pending.popleft()
+                    if isinstance(done_result, Future):
+                        if in_flight.get(done_output) is done_result:
+                            del in_flight[done_output]
+                        done_result = done_result.result()
+                    yield done_path, done_output, done_result
             
+            for svg_path, output_path, result in pending:
+                yield svg_path, output_path, result.result() if isinstance(result, Future) else result
+
+    def _record_icon_variable_name(self, svg_path: Path, output_path: Path):
+        """Remember the ImageVector variable name written for svg_path to output_path."""
+        variable_name = self.generator.convert_to_pascal_case(svg_path.stem)
+        if self._icon_variable_names.setdefault(output_path, variable_name) != variable_name:
+            # Several inputs map to this file; read back whichever was written last
+            self._icon_variable_names[output_path] = None
+
+    def convert_single_file(self, svg_path: Path, output_path: Optional[Path] = None) -> bool:
+        """Convert a single SVG file to Compose ImageVector.
+        
+        output_path is derived from svg_path when not given.
+        """
+        try:
+            kotlin_code = self._generate_kotlin_code(svg_path)
             if self.config.dry_run:
-                self.logger.info(f"DRY RUN: Would generate {class_name}.kt")
-                self.logger.debug("Generated code preview:")
-                self.logger.debug(kotlin_code[:500] + "..." if len(kotlin_code) > 500 else kotlin_code)
                 return True
-            
-            # Determine output path
-            output_path = self.file_processor.get_output_path(svg_path)
-            
-            # Create output directory structure
-            self.file_processor.create_output_structure(svg_path)
-            
-            # Write Kotlin file
-            success = self.file_processor.write_kotlin_file(kotlin_code, output_path)
-            
-            if success:
-                self.logger.debug(f"Written Kotlin file: {output_path}")
-            
-            return success
+            if output_path is None:
+                output_path = self.file_processor.get_output_path(svg_path)
+            return self._write_kotlin_file(kotlin_code, output_path)
             
         except Exception as e:
             self.logger.error(f"Error converting {svg_path}: {e}")
             return False
 
+    def _generate_kotlin_code(self, svg_path: Path) -> str:
+        """Parse an SVG file and generate its Kotlin code.
+        
+        Parse and generation errors propagate.
+        """
+        # Parse SVG file
+        self.logger.debug("Parsing SVG file: %s", svg_path)
+        svg_data = self.parser.parse_svg_file(svg_path)
+        
+        # Generate class name from filename
+        class_name = svg_path.stem
+        
+        # Get relative path from input directory for package structure
+        relative_path = self.file_processor.get_relative_path(svg_path)
+        
+        # Generate Kotlin code
+        self.logger.debug("Generating Kotlin code for: %s", class_name)
+        kotlin_code = self.generator.generate_vector_drawable(svg_data, class_name, relative_path)
+        
+        if self.config.dry_run:
+            self.logger.info(f"DRY RUN: Would generate {class_name}.kt")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Generated code preview:")
+                self.logger.debug(kotlin_code[:500] + "..." if len(kotlin_code) > 500 else kotlin_code)
+        
+        return kotlin_code
+
+    def _write_kotlin_file(self, kotlin_code: str, output_path: Path) -> bool:
+        """Write generated Kotlin code (creates the output directory on first use)."""
+        success = self.file_processor.write_kotlin_file(kotlin_code, output_path)
+        
+        if success:
+            self.logger.debug("Written Kotlin file: %s", output_path)
+        
+        return success
+
     def generate_iconpack_file(self) -> Optional[Path]:
         """Generate an IconPack file with easy access to all icons."""
         try:
@@ -168,8 +356,9 @@ class SVGToComposeConverter:
                 self.logger.warning("No output files found for IconPack generation")
                 return None
             
-            # Generate IconPack content
-            iconpack_content = self._generate_iconpack_content(output_files)
+            # Collect the icons up front: a rerun without --clean lists the
+            # previous IconPack file, which must be read before it is rewritten
+            icon_data = self._collect_iconpack_entries(output_files)
             
             # Write IconPack file with custom name
             iconpack_filename = f"{self.config.iconpack_name}.kt"
@@ -179,7 +368,9 @@ class SVGToComposeConverter:
                 self.logger.info(f"DRY RUN: Would generate IconPack file at {iconpack_path}")
                 return iconpack_path
             
-            success = self.file_processor.write_kotlin_file(iconpack_content, iconpack_path)
+            # Stream the lines to disk rather than joining and encoding the whole file
+            success = self.file_processor.write_kotlin_parts(
+                self._generate_iconpack_parts(icon_data), iconpack_path)
             
             if success:
                 self.logger.info(f"Generated IconPack file: {iconpack_path}")
@@ -192,62 +383,41 @@ class SVGToComposeConverter:
             self.logger.error(f"Error generating IconPack file: {e}")
             return None
 
-    def _generate_iconpack_content(self, output_files: list[Path]) -> str:
-        """Generate content for the IconPack file."""
+    def _collect_iconpack_entries(self, output_files: list[Path]) -> List[IconEntry]:
+        """Build the sorted, de-duplicated icon entries for the IconPack file."""
         icon_data = []
         
-        for file_path in output_files:
-            # Extract the original SVG filename to get the proper variable name
-            # We need to read the actual variable name from the generated file
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Find the variable name: look for "val VariableName: ImageVector"
-                    import re
-                    match = re.search(r'val (\w+): ImageVector', content)
-                    if match:
-                        actual_variable_name = match.group(1)
-                    else:
-                        # Fallback to filename if pattern not found
-                        actual_variable_name = file_path.stem
-            except Exception:
-                # Fallback to filename if reading fails
-                actual_variable_name = file_path.stem
-            
+        # Files written by this run have known names; only read back the others
+        # (left over from earlier runs), concurrently
+        variable_names = [self._icon_variable_names.get(file_path) for file_path in output_files]
+        unknown = [i for i, name in enumerate(variable_names) if name is None]
+        if unknown:
+            with ThreadPoolExecutor(max_workers=ICONPACK_READER_THREADS) as reader:
+                for i, name in zip(unknown, reader.map(self._read_icon_variable_name,
+                                                       [output_files[i] for i in unknown])):
+                    variable_names[i] = name
+        
+        for file_path, actual_variable_name in zip(output_files, variable_names):
             # Store relative path for nested structure
             relative_path = file_path.relative_to(self.config.output_dir)
-            icon_data.append({
-                'name': actual_variable_name,
-                'path': relative_path,
-                'variable_name': actual_variable_name
-            })
+            icon_data.append(IconEntry(actual_variable_name, relative_path, actual_variable_name))
         
         # Sort by icon name
-        icon_data.sort(key=lambda x: x['name'])
+        icon_data.sort(key=lambda x: x.name)
         
         # Handle duplicate names by adding directory suffix
-        icon_data = self._resolve_duplicate_names(icon_data)
-        
-        # No imports needed since we're using fully qualified names
-        
-        # Generate individual icon properties using fully qualified names to avoid loops
-        icon_properties = []
-        for icon in icon_data:
-            # Build full package name including directory structure
-            icon_package = self.generator._build_package_name(str(icon['path']))
-            icon_properties.append(f"    val {icon['name']}: ImageVector get() = {icon_package}.{icon['variable_name']}")
-        
-        # Generate icon list using fully qualified names
-        icon_list_items = []
-        for icon in icon_data:
-            icon_package = self.generator._build_package_name(str(icon['path']))
-            icon_list_items.append(f"{icon_package}.{icon['variable_name']}")
+        return self._resolve_duplicate_names(icon_data)
+
+    def _generate_iconpack_parts(self, icon_data: List[IconEntry]) -> Iterator[str]:
+        """Generate the IconPack file content line by line.
         
-        # Generate when clauses for getByName function using fully qualified names
-        when_clauses = []
-        for icon in icon_data:
-            icon_package = self.generator._build_package_name(str(icon['path']))
-            when_clauses.append(f'        "{icon["name"]}" -> {icon_package}.{icon["variable_name"]}')
+        The lines can be written out as they are produced, so neither the
+        whole file nor any of its per-icon sections is built as one string.
+        """
+        # No imports needed since we're using fully qualified names; build full
+        # package names (including directory structure) once per icon
+        qualified_names = [f"{self.generator._build_package_name(str(icon.path))}.{icon.variable_name}"
+                           for icon in icon_data]
         
         # Build the content string step by step to avoid f-string issues
         header = f"""package {self.config.package_name}
@@ -264,15 +434,13 @@ import androidx.compose.ui.graphics.vector.ImageVector
  */
 object {self.config.iconpack_name} {{"""
 
-        properties_section = chr(10).join(icon_properties)
-        
-        icon_list_formatted = ',\n        '.join(icon_list_items)
-        list_section = f"""    
+        list_header = """    
     /**
      * List of all icons in this pack.
      */
     val All: List<ImageVector> = listOf(
-        {icon_list_formatted}
+        """
+        list_footer = """
     )
     
     /**
@@ -280,29 +448,61 @@ object {self.config.iconpack_name} {{"""
      */
     val Count: Int = All.size"""
 
-        when_clauses_formatted = chr(10).join(when_clauses)
-        function_section = f"""    
+        function_header = """    
     /**
      * Get icon by name (case-sensitive).
      */
-    fun getByName(name: String): ImageVector? = when (name) {{
-{when_clauses_formatted}
+    fun getByName(name: String): ImageVector? = when (name) {
+"""
+        function_footer = """
         else -> null
-    }}
-}}"""
-
-        iconpack_content = header + chr(10) + properties_section + list_section + function_section
-        return iconpack_content
-
-    def _resolve_duplicate_names(self, icon_data: list) -> list:
+    }
+}"""
+
+        yield header
+        for icon, qualified_name in zip(icon_data, qualified_names):
+            yield f"\n    val {icon.name}: ImageVector get() = {qualified_name}"
+        
+        yield list_header
+        for i, qualified_name in enumerate(qualified_names):
+            yield f",\n        {qualified_name}" if i else qualified_name
+        yield list_footer
+        
+        yield function_header
+        for i, (icon, qualified_name) in enumerate(zip(icon_data, qualified_names)):
+            clause = f'        "{icon.name}" -> {qualified_name}'
+            yield f"\n{clause}" if i else clause
+        yield function_footer
+
+    def _read_icon_variable_name(self, file_path: Path) -> str:
+        """Read the ImageVector variable name declared in a generated file."""
+        # Extract the original SVG filename to get the proper variable name
+        # We need to read the actual variable name from the generated file
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read(ICONPACK_HEAD_CHARS)
+                # Find the variable name: look for "val VariableName: ImageVector"
+                match = _RE_ICON_VAL.search(content)
+                if not match:
+                    match = _RE_ICON_VAL.search(content + f.read())
+                if match:
+                    return match.group(1)
+        except Exception:
+            pass
+        
+        # Fallback to filename if pattern not found or reading fails
+        return file_path.stem
+
+    def _resolve_duplicate_names(self, icon_data: List[IconEntry]) -> List[IconEntry]:
         """Resolve duplicate icon names by adding directory suffix."""
+        # Names are usually unique already; then there is nothing to resolve
+        if len({icon.name for icon in icon_data}) == len(icon_data):
+            return icon_data
+        
         # Group icons by name to find duplicates
-        name_groups = {}
+        name_groups = defaultdict(list)
         for icon in icon_data:
-            name = icon['name']
-            if name not in name_groups:
-                name_groups[name] = []
-            name_groups[name].append(icon)
+            name_groups[icon.name].append(icon)
         
         # Process each group
         resolved_icons = []
@@ -314,7 +514,7 @@ object {self.config.iconpack_name} {{"""
                 # Handle duplicates by adding directory suffix
                 for icon in icons:
                     # Get the immediate parent directory name
-                    path_parts = icon['path'].parts
+                    path_parts = icon.path.parts
                     if len(path_parts) > 1:
                         # Get the directory name (second to last part, since last is filename)
                         dir_name = path_parts[-2]
@@ -326,7 +526,7 @@ object {self.config.iconpack_name} {{"""
                         new_name = f"{name}Root"
                     
                     # Update the icon data
-                    icon['name'] = new_name
+                    icon.name = new_name
                     resolved_icons.append(icon)
         
         return resolved_icons
@@ -343,11 +543,28 @@ object {self.config.iconpack_name} {{"""
         
         if report.errors:
             self.logger.info("\nErrors:")
+            if report.dropped_errors:
+                self.logger.info(f"  ({report.dropped_errors} earlier errors not shown)")
             for error in report.errors:
                 self.logger.info(f"  - {error}")
         
-        if report.output_files and not self.config.dry_run:
-            self.logger.info(f"\nGenerated {len(report.output_files)} Kotlin files in {self.config.output_dir}")
+        if report.successful_conversions and not self.config.dry_run:
+            self.logger.info(f"\nGenerated {report.successful_conversions} Kotlin files in {self.config.output_dir}")
+
+
+# Per-process converter used by pool workers, created once by _init_worker
+_worker_converter: Optional[SVGToComposeConverter] = None
+
+
+def _init_worker(config: ConverterConfig):
+    """Create the converter each worker process reuses for its files."""
+    global _worker_converter
+    _worker_converter = SVGToComposeConverter(config)
+
+
+def _convert_group_in_worker(files: Tuple[Tuple[Path, Optional[Path]], ...]) -> List[bool]:
+    """Convert (svg_path, output_path) pairs sharing an output path, in order, in a worker process."""
+    return [_worker_converter.convert_single_file(svg_path, output_path) for svg_path, output_path in files]
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -420,6 +637,12 @@ def create_parser() -> argparse.ArgumentParser:
         help='Name for the generated IconPack object (default: Icons)'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of worker processes for large batches (default: CPU count, 1 disables)'
+    )
+    
     parser.add_argument(
         '--interactive',
         action='store_true',
@@ -451,13 +674,15 @@ def validate_args(args: argparse.Namespace) -> ConverterConfig:
     if args.input and not args.input.is_dir():
         raise NotADirectoryError(f"Input path is not a directory: {args.input}")
     
+    if args.jobs is not None and args.jobs < 1:
+        raise ValueError(f"Number of jobs must be at least 1: {args.jobs}")
+    
     # Normalize package name - replace dashes with underscores and validate
     package = args.package or "com.example.icons"
     normalized_package = normalize_package_name(package)
     
     # Validate normalized package name
-    package_pattern = r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$'
-    if not re.match(package_pattern, normalized_package):
+    if not _RE_PACKAGE_NAME.match(normalized_package):
         raise ValueError(f"Invalid package name: {normalized_package} (normalized from {package})")
     
     # Create output directory if it doesn't exist
@@ -472,30 +697,58 @@ def validate_args(args: argparse.Namespace) -> ConverterConfig:
         dry_run=args.dry_run or False,
         clean_output=args.clean or False,
         generate_index=args.generate_index or False,
-        iconpack_name=args.iconpack_name or "Icons"
+        iconpack_name=args.iconpack_name or "Icons",
+        jobs=args.jobs
     )
 
 
 def normalize_package_name(package_name: str) -> str:
     """Normalize package name to be valid for Kotlin/Java."""
-    # Replace dashes with underscores
-    normalized = package_name.replace('-', '_')
-    
-    # Ensure each part starts with lowercase and contains only valid characters
-    parts = normalized.split('.')
-    normalized_parts = []
+    # Replace dashes with underscores, lowercase and remove invalid characters
+    # (keeping the dots between parts) in one pass over the whole name
+    normalized = _RE_PACKAGE_INVALID_CHARS.sub('', package_name.replace('-', '_').lower())
     
-    for part in parts:
-        # Remove invalid characters and ensure it starts with a letter
-        clean_part = re.sub(r'[^a-zA-Z0-9_]', '', part.lower())
-        if clean_part and not clean_part[0].isalpha():
-            clean_part = 'pkg_' + clean_part
-        if clean_part:
-            normalized_parts.append(clean_part)
+    # Drop empty parts and ensure each part starts with a letter
+    normalized_parts = [part if part[0].isalpha() else 'pkg_' + part
+                        for part in normalized.split('.') if part]
     
     return '.'.join(normalized_parts) if normalized_parts else 'com.example.icons'
 
 
+def _scan_svg_directory(dir_path: str) -> Tuple[int, List[str]]:
+    """Count .svg entries in one directory and list its subdirectories."""
+    svg_count = 0
+    subdirs = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.svg'):
+                    svg_count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return svg_count, subdirs
+
+
+def _count_svg_files(root: Path) -> int:
+    """Count .svg entries below root, listing directories concurrently.
+    
+    Directories are scanned a level at a time so directory listing latency
+    overlaps across the thread pool.
+    """
+    svg_count = 0
+    pending = [os.fspath(root)]
+    with ThreadPoolExecutor(max_workers=SVG_COUNT_THREADS) as executor:
+        while pending:
+            next_pending = []
+            for count, subdirs in executor.map(_scan_svg_directory, pending):
+                svg_count += count
+                next_pending.extend(subdirs)
+            pending = next_pending
+    return svg_count
+
+
 def interactive_mode() -> ConverterConfig:
     """Run in interactive mode to collect user input."""
     print("🎨 SVG to Compose Vector Drawable Converter")
@@ -517,7 +770,7 @@ def interactive_mode() -> ConverterConfig:
             continue
         
         # Count SVG files
-        svg_count = len(list(input_path.rglob("*.svg")))
+        svg_count = _count_svg_files(input_path)
         print(f"✅ Found {svg_count} SVG files")
         if svg_count == 0:
             print("⚠️  No SVG files found, but continuing...")
@@ -594,22 +847,30 @@ def interactive_mode() -> ConverterConfig:
 
 
 def load_config_file(config_path: Path) -> dict:
-    """Load configuration from file."""
+    """Load configuration from file, parsing it with orjson when installed."""
     try:
-        import json
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        data = Path(config_path).read_bytes()
+        try:
+            import orjson
+        except ImportError:
+            import json
+            return json.loads(data)
+        return orjson.loads(data)
     except Exception as e:
         print(f"❌ Error loading config file: {e}")
         sys.exit(1)
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+    
+    argv defaults to sys.argv[1:]; passing it lets scripts run the converter
+    in-process instead of spawning a new interpreter.
+    """
     try:
         # Parse command line arguments
         parser = create_parser()
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
         
         # Handle interactive mode
         if args.interactive:
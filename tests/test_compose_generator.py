@@ -0,0 +1,129 @@
+"""Tests for the Compose code generator."""
+
+import unittest
+
+from converter.compose_generator import ComposeGenerator, _A, _C, _H_REL, _L, _M, _V_REL, _Z
+
+
+class ParsePathCommandsTest(unittest.TestCase):
+    """Tests for ComposeGenerator._parse_path_commands."""
+
+    def setUp(self):
+        self.generator = ComposeGenerator()
+
+    def test_compact_numbers(self):
+        # A sign or a second decimal point starts a new number
+        commands = self.generator._parse_path_commands("M1-2L-1.5.5C.5.5-1-1 2e1 3Z")
+        
+        self.assertEqual(commands, [
+            (_M, 1.0, -2.0),
+            (_L, -1.5, 0.5),
+            (_C, 0.5, 0.5, -1.0, -1.0, 20.0, 3.0),
+            (_Z,),
+        ])
+
+    def test_relative_commands(self):
+        commands = self.generator._parse_path_commands("M10 10l2 3h4v-5c1 1 2 2 3 3")
+        
+        self.assertEqual(commands, [
+            (_M, 10.0, 10.0),
+            (_L, 12.0, 13.0),
+            (_H_REL, 4.0),
+            (_V_REL, -5.0),
+            (_C, 17.0, 9.0, 18.0, 10.0, 19.0, 11.0),
+        ])
+
+
+    def test_compact_arc_flags(self):
+        # Heroicons "check-circle": both arcs write their flags without separators
+        path = "M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"
+        
+        commands = self.generator._parse_path_commands(path)
+        
+        arcs = [command for command in commands if command[0] == _A]
+        self.assertEqual(arcs, [
+            (_A, 9.0, 9.0, 0.0, 'true', 'true', 3.0, 12.0),
+            (_A, 9.0, 9.0, 0.0, 'false', 'true', 21.0, 12.0),
+        ])
+
+    def test_flag_followed_by_decimal(self):
+        commands = self.generator._parse_path_commands("M0 0A5 5 0 01.5 2")
+        
+        self.assertEqual(commands[-1], (_A, 5.0, 5.0, 0.0, 'false', 'true', 0.5, 2.0))
+
+    def test_separated_arc_flags(self):
+        commands = self.generator._parse_path_commands("M0 0a5 5 0 1 0 10 0")
+        
+        self.assertEqual(commands[-1], (_A, 5.0, 5.0, 0.0, 'true', 'false', 10.0, 0.0))
+
+
+class FormatPathCommandsTest(unittest.TestCase):
+    """Tests for the builder calls emitted for parsed path data."""
+
+    def setUp(self):
+        self.generator = ComposeGenerator()
+
+    def emit(self, path_data):
+        lines = []
+        self.generator._format_commands(self.generator._parse_path_commands(path_data), 0, lines)
+        return lines
+
+    def test_curve_and_arc_commands(self):
+        self.assertEqual(self.emit("M0 0S1 2 3 4Q5 6 7 8T9 10A1 2 30 1 0 11 12"), [
+            "moveTo(0f, 0f)",
+            "reflectiveCurveTo(1.00f, 2.00f, 3.00f, 4.00f)",
+            "quadTo(5.00f, 6.00f, 7.00f, 8.00f)",
+            "reflectiveQuadTo(9.00f, 10.00f)",
+            "arcTo(1.00f, 2.00f, 30.00f, true, false, 11.00f, 12.00f)",
+        ])
+
+    def test_relative_curve_and_arc_commands(self):
+        self.assertEqual(self.emit("M10 10s1 2 3 4q1 1 2 2t1 1a1 1 0 0 1 -4 -4"), [
+            "moveTo(10f, 10f)",
+            "reflectiveCurveTo(11.00f, 12.00f, 13.00f, 14.00f)",
+            "quadTo(14.00f, 15.00f, 15.00f, 16.00f)",
+            "reflectiveQuadTo(16.00f, 17.00f)",
+            "arcTo(1.00f, 1.00f, 0.00f, false, true, 12.00f, 13.00f)",
+        ])
+
+    def test_implicit_lineto_after_moveto(self):
+        self.assertEqual(self.emit("M1 2 3 4 5 6"), [
+            "moveTo(1f, 2f)",
+            "lineTo(3f, 4f)",
+            "lineTo(5f, 6f)",
+        ])
+
+    def test_implicit_relative_lineto_after_relative_moveto(self):
+        self.assertEqual(self.emit("m1 2 3 4 -2 1"), [
+            "moveTo(1f, 2f)",
+            "lineTo(4f, 6f)",
+            "lineTo(2f, 7f)",
+        ])
+
+    def test_repeated_coordinates(self):
+        self.assertEqual(self.emit("M0 0L1 1 2 2c1 1 2 2 3 3 1 1 2 2 3 3"), [
+            "moveTo(0f, 0f)",
+            "lineTo(1f, 1f)",
+            "lineTo(2f, 2f)",
+            "curveTo(3.00f, 3.00f, 4.00f, 4.00f, 5.00f, 5.00f)",
+            "curveTo(6.00f, 6.00f, 7.00f, 7.00f, 8.00f, 8.00f)",
+        ])
+
+    def test_close_resets_current_point(self):
+        # After z the current point is the subpath start, (10, 10) and then
+        # (13, 13), rather than the last point drawn
+        self.assertEqual(self.emit("M10 10l5 0 0 5zl1 1m2 2l4 0zl1 0"), [
+            "moveTo(10f, 10f)",
+            "lineTo(15f, 10f)",
+            "lineTo(15f, 15f)",
+            "close()",
+            "lineTo(11f, 11f)",
+            "moveTo(13f, 13f)",
+            "lineTo(17f, 13f)",
+            "close()",
+            "lineTo(14f, 13f)",
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Tests for file processing helpers."""
+
+import unittest
+
+from converter.file_processor import MAX_REPORTED_ERRORS, ConversionReport
+
+
+class ConversionReportTest(unittest.TestCase):
+    """Tests for ConversionReport error bookkeeping."""
+
+    def test_errors_within_limit(self):
+        report = ConversionReport(2, 0, 2)
+        report.add_error("first")
+        report.add_error("second")
+
+        self.assertEqual(list(report.errors), ["first", "second"])
+        self.assertEqual(report.dropped_errors, 0)
+
+    def test_oldest_errors_are_dropped_and_counted(self):
+        report = ConversionReport(0, 0, 0)
+        for i in range(MAX_REPORTED_ERRORS + 5):
+            report.add_error(f"error {i}")
+
+        self.assertEqual(len(report.errors), MAX_REPORTED_ERRORS)
+        self.assertEqual(report.errors[0], "error 5")
+        self.assertEqual(report.dropped_errors, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
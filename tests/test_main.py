@@ -0,0 +1,54 @@
+"""Tests for the converter driver in main.py."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from main import ConverterConfig, PARALLEL_MIN_FILES, SVGToComposeConverter
+
+_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">'
+        '<path d="M{0} {0}L{1} {1}Z"/></svg>')
+
+
+class OutputPathCollisionTest(unittest.TestCase):
+    """Inputs converting to the same .kt file keep the last one in input order."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.input_dir = Path(tmp.name) / 'svg'
+        self.output_dir = Path(tmp.name) / 'out'
+        self.input_dir.mkdir()
+
+        # ic-xN.svg and ic_xN.svg both become IcXN.kt; the second one must win
+        for i in range(PARALLEL_MIN_FILES // 2 + 1):
+            (self.input_dir / f'ic-x{i}.svg').write_text(_SVG.format(1, 2))
+            (self.input_dir / f'ic_x{i}.svg').write_text(_SVG.format(9, 8))
+        self.svg_files = sorted(self.input_dir.glob('*.svg'))
+
+    def convert(self, jobs):
+        config = ConverterConfig(self.input_dir, self.output_dir, 'com.example.icons', jobs=jobs)
+        converter = SVGToComposeConverter(config)
+        with self.assertLogs('main', 'WARNING') as logs:
+            results = list(converter._convert_files(self.svg_files))
+
+        self.assertEqual([(svg_path, success) for svg_path, _, success in results],
+                         [(svg_path, True) for svg_path in self.svg_files])
+        self.assertEqual([output_path.name for _, output_path, _ in results],
+                         [f"IcX{svg_path.stem[4:]}.kt" for svg_path in self.svg_files])
+        self.assertEqual(len(logs.records), len(self.svg_files) // 2)
+
+        kotlin_files = sorted(self.output_dir.glob('*.kt'))
+        self.assertEqual(len(kotlin_files), len(self.svg_files) // 2)
+        for kotlin_file in kotlin_files:
+            self.assertIn('moveTo(9f, 9f)', kotlin_file.read_text())
+
+    def test_in_process(self):
+        self.convert(jobs=1)
+
+    def test_process_pool(self):
+        self.convert(jobs=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for the SVG parser."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from converter import svg_parser
+from converter.svg_parser import SVGParser
+
+_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">
+  <!-- exported by a design tool -->
+  <?editor-state collapsed?>
+  <path d="M1 1L2 2Z"/>
+  <g transform="translate(1, 1)">
+    <path d="M3 3L4 4Z"/>
+  </g>
+</svg>
+"""
+
+
+class ParseSvgFileTest(unittest.TestCase):
+    """Tests for SVGParser.parse_svg_file."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.svg_path = Path(tmp.name) / 'icon.svg'
+        self.svg_path.write_text(_SVG, encoding='utf-8')
+
+    def test_paths_and_groups(self):
+        svg_data = SVGParser().parse_svg_file(self.svg_path)
+
+        self.assertEqual(svg_data.filename, 'icon')
+        self.assertEqual([path.d for path in svg_data.paths], ['M1 1L2 2Z', 'M3 3L4 4Z'])
+        self.assertEqual(len(svg_data.groups), 1)
+        self.assertEqual([path.d for path in svg_data.groups[0].children], ['M3 3L4 4Z'])
+
+    @unittest.skipUnless(svg_parser._XML_PARSER is not None, "lxml is not installed")
+    def test_lxml_parser(self):
+        self.assertEqual(svg_parser.ET.__name__, 'lxml.etree')
+
+        svg_data = SVGParser().parse_svg_file(self.svg_path)
+
+        # Comments and processing instructions are dropped, leaving only the shapes
+        self.assertEqual([path.d for path in svg_data.paths], ['M1 1L2 2Z', 'M3 3L4 4Z'])
+        self.assertEqual([path.d for path in svg_data.groups[0].children], ['M3 3L4 4Z'])
+
+
+if __name__ == '__main__':
+    unittest.main()